@@ -0,0 +1,207 @@
+import json
+from functools import lru_cache
+
+import numpy as np
+
+import crop_kb
+
+# Declarative weather alert rules.
+#   risk      - climate risk name; a more specific rule replaces a general one
+#               with the same risk (crop + country > crop > country > "*")
+#   field     - forecast column: temp, humidity, rain or wind
+#   op        - ">" or "<"
+#   value     - threshold
+#   window    - optional number of 3h slots to sum over (e.g. 8 = rolling 24h)
+#   crops     - list of crops (crop_kb names; aliases such as "Peanut" are
+#               mapped with crop_kb.canonical), or "*" for all
+#   countries - list of countries, or "*" for all
+#   severity  - watch, warning or severe
+#   action    - organic resilience action shown with the alert
+DEFAULT_RULES = [
+    {"risk": "High Temperature", "field": "temp", "op": ">", "value": 35, "severity": "warning",
+     "action": "Use heat-tolerant varieties and increase shading."},
+    {"risk": "Heavy Rain", "field": "rain", "op": ">", "value": 20, "severity": "warning",
+     "action": "Improve drainage and use raised beds."},
+    {"risk": "Drought", "field": "rain", "op": "<", "value": 1, "window": 40, "severity": "watch",
+     "action": "Implement drip irrigation and mulching."},
+    {"risk": "Strong Winds", "field": "wind", "op": ">", "value": 15, "severity": "warning",
+     "action": "Use windbreaks and plant support systems."},
+    {"risk": "Flooding", "field": "rain", "op": ">", "value": 60, "window": 8, "severity": "severe",
+     "action": "Elevated planting beds and rapid drainage systems."},
+    {"risk": "Humidity Stress", "field": "humidity", "op": ">", "value": 90, "severity": "watch",
+     "action": "Increase plant spacing and improve air circulation."},
+
+    # Crop-specific overrides
+    {"risk": "High Temperature", "field": "temp", "op": ">", "value": 30, "severity": "warning",
+     "crops": ["Coffee", "Cabbage", "Lettuce", "Carrot"],
+     "action": "Provide shade trees or shade nets and irrigate in the early morning."},
+    {"risk": "Humidity Stress", "field": "humidity", "op": ">", "value": 85, "severity": "warning",
+     "crops": ["Tomato", "Bell Pepper", "Eggplant", "Onion", "Garlic"],
+     "action": "Prune lower leaves, widen spacing and apply preventive compost tea against blight."},
+    {"risk": "Strong Winds", "field": "wind", "op": ">", "value": 10, "severity": "warning",
+     "crops": ["Banana", "Papaya", "Corn", "Sugarcane"],
+     "action": "Prop tall plants, plant windbreak rows and harvest mature bunches early."},
+    {"risk": "Flooding", "field": "rain", "op": ">", "value": 120, "window": 8, "severity": "severe",
+     "crops": ["Rice", "Taro"],
+     "action": "Open field drains to keep water depth below the panicle / leaf base."},
+    {"risk": "Heavy Rain", "field": "rain", "op": ">", "value": 10, "severity": "warning",
+     "crops": ["Mung Bean", "Soybean", "Groundnuts", "String Beans", "Pineapple"],
+     "action": "Raise beds and avoid field operations until soil drains to prevent root rot."},
+
+    # Country-specific overrides
+    {"risk": "Strong Winds", "field": "wind", "op": ">", "value": 12, "severity": "warning",
+     "countries": ["Philippines"],
+     "action": "Follow PAGASA typhoon bulletins; secure trellises and harvest early where possible."},
+    {"risk": "Flooding", "field": "rain", "op": ">", "value": 45, "window": 8, "severity": "severe",
+     "countries": ["Suriname"],
+     "action": "Clear polder drains and trenches; move seedlings to raised nursery beds."},
+]
+
+SEVERITIES = ["watch", "warning", "severe"]
+UNITS = {"temp": "°C", "humidity": "%", "rain": "mm", "wind": "m/s"}
+
+ALERT_DTYPE = np.dtype([
+    ("farm", np.int32),
+    ("slot", np.int16),
+    ("dt", np.int64),
+    ("rule", np.int16),
+    ("value", np.float32),
+])
+
+
+def _specificity(rule):
+    return 2 * (rule.get("crops", "*") != "*") + (rule.get("countries", "*") != "*")
+
+
+# Rules compiled into arrays: rules sorted by risk, grouped by (field, op, window)
+# so every group is evaluated as one broadcast comparison.
+class RuleSet:
+    def __init__(self, rules):
+        self.rules = sorted(rules, key=lambda r: (r["risk"], _specificity(r)))
+        self.risks = sorted({r["risk"] for r in self.rules})
+        self.risk_of_rule = np.array([self.risks.index(r["risk"]) for r in self.rules], dtype=np.int16)
+        self.risk_starts = np.searchsorted(self.risk_of_rule, np.arange(len(self.risks)))
+        self.specificity = np.array([_specificity(r) for r in self.rules], dtype=np.int8)
+        self.severity = np.array([SEVERITIES.index(r.get("severity", "warning")) for r in self.rules])
+
+        # Vocabularies; code 0 stands for "not named by any rule"
+        crops = sorted({crop_kb.canonical(c) for r in self.rules if r.get("crops", "*") != "*" for c in r["crops"]})
+        countries = sorted({c for r in self.rules if r.get("countries", "*") != "*" for c in r["countries"]})
+        self.crop_codes = {c: i + 1 for i, c in enumerate(crops)}
+        self.country_codes = {c: i + 1 for i, c in enumerate(countries)}
+        self.crop_ok = self._membership("crops", self.crop_codes)
+        self.country_ok = self._membership("countries", self.country_codes)
+
+        self.groups = {}
+        for i, rule in enumerate(self.rules):
+            key = (rule["field"], rule["op"], rule.get("window", 1))
+            self.groups.setdefault(key, []).append(i)
+        self.groups = {
+            key: (np.array(idx), np.array([self.rules[i]["value"] for i in idx], dtype=np.float32))
+            for key, idx in self.groups.items()
+        }
+
+    # (rules x vocabulary) table of which rule applies to which crop / country code
+    def _membership(self, attr, codes):
+        table = np.zeros((len(self.rules), len(codes) + 1), dtype=bool)
+        for i, rule in enumerate(self.rules):
+            names = rule.get(attr, "*")
+            if names == "*":
+                table[i] = True
+            else:
+                if attr == "crops":
+                    names = [crop_kb.canonical(n) for n in names]
+                table[i, [codes[n] for n in names]] = True
+        return table
+
+    # (farms x rules) matrix of the rules in force for each farm, after overrides
+    def applicable(self, crops, countries):
+        crop_idx = np.array([self.crop_codes.get(crop_kb.canonical(c), 0) for c in crops], dtype=np.intp)
+        country_idx = np.array([self.country_codes.get(c, 0) for c in countries], dtype=np.intp)
+        applies = self.crop_ok[:, crop_idx].T & self.country_ok[:, country_idx].T
+        if not applies.size:
+            return applies
+        score = np.where(applies, self.specificity + 1, 0)
+        best = np.maximum.reduceat(score, self.risk_starts, axis=1)
+        return applies & (score == best[:, self.risk_of_rule])
+
+
+@lru_cache(maxsize=32)
+def _compile(rules_json):
+    return RuleSet(json.loads(rules_json))
+
+
+# Compile a rule list once; identical rule lists share the cached RuleSet
+def compile_rules(rules=None):
+    return _compile(json.dumps(rules if rules is not None else DEFAULT_RULES, sort_keys=True))
+
+
+def _windowed(values, window):
+    if window <= 1:
+        return values
+    # Rolling sum over the previous `window` slots; NaN until the window is full
+    csum = np.nancumsum(values, axis=1, dtype=np.float64)
+    out = np.full(values.shape, np.nan, dtype=np.float32)
+    if values.shape[1] >= window:
+        out[:, window - 1:] = csum[:, window - 1:]
+        out[:, window:] -= csum[:, :-window]
+    return out
+
+
+# Evaluate a compiled rule set over (farms x slots) forecast arrays, e.g.
+# ForecastStore.arrays() or weather_risk.batch_arrays(). `crops` and `countries`
+# give each farm's crop and country. Returns a structured array of alerts.
+def evaluate(rule_set, arrays, crops, countries, mask=None):
+    arrays = {k: np.atleast_2d(v) for k, v in arrays.items()}
+    valid = arrays["dt"] > 0
+    if mask is not None:
+        valid &= np.atleast_2d(mask)
+    in_force = rule_set.applicable(crops, countries)
+
+    found = []
+    for (field, op, window), (idx, thresholds) in rule_set.groups.items():
+        values = _windowed(arrays[field], window)
+        with np.errstate(invalid="ignore"):
+            if op == ">":
+                hits = values[..., None] > thresholds
+            else:
+                hits = values[..., None] < thresholds
+        hits &= valid[..., None] & in_force[:, None, idx]
+        farm, slot, k = np.nonzero(hits)
+        alerts = np.empty(len(farm), dtype=ALERT_DTYPE)
+        alerts["farm"] = farm
+        alerts["slot"] = slot
+        alerts["dt"] = arrays["dt"][farm, slot]
+        alerts["rule"] = idx[k]
+        alerts["value"] = values[farm, slot]
+        found.append(alerts)
+
+    if not found:
+        return np.empty(0, dtype=ALERT_DTYPE)
+    alerts = np.concatenate(found)
+    return alerts[np.lexsort((alerts["rule"], alerts["dt"], alerts["farm"]))]
+
+
+def describe(rule):
+    if rule.get("window", 1) > 1:
+        span = f" over {rule['window'] * 3}h"
+    else:
+        span = " per 3h" if rule["field"] == "rain" else ""
+    return f"{rule['field']} {rule['op']} {rule['value']} {UNITS[rule['field']]}{span}"
+
+
+# Rules in force for one country and crop, as table rows for the dashboard
+def risk_table(country, crop, rule_set=None):
+    rule_set = rule_set or compile_rules()
+    in_force = rule_set.applicable([crop], [country])[0]
+    return [
+        {
+            "Country": country,
+            "Crop": crop,
+            "Climate Risk": rule["risk"],
+            "Risk Threshold": describe(rule),
+            "Severity": rule.get("severity", "warning").title(),
+            "Resilience Action": rule["action"],
+        }
+        for rule, ok in zip(rule_set.rules, in_force) if ok
+    ]
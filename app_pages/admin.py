@@ -0,0 +1,43 @@
+import streamlit as st
+
+# 🌱 AgriVigor Admin Panel Login System
+
+# Sample credentials
+CREDENTIALS = {
+    "admin@agrivigor.org": "Greenfarms2025"
+}
+
+# Setup Streamlit page
+st.set_page_config(page_title="AgriVigor Admin Panel", layout="centered")
+
+st.title("🌱 AgriVigor Admin Panel")
+st.header("🔐 Login")
+
+# Initialize session state
+if "logged_in" not in st.session_state:
+    st.session_state.logged_in = False
+    st.session_state.user = None
+
+# Login form
+if not st.session_state.logged_in:
+    with st.form("login_form"):
+        email = st.text_input("Email")
+        password = st.text_input("Password", type="password")
+        submitted = st.form_submit_button("Login")
+
+        if submitted:
+            if CREDENTIALS.get(email) == password:
+                st.session_state.logged_in = True
+                st.session_state.user = email
+                st.success(f"✅ Welcome {email}!")
+                st.rerun()
+            else:
+                st.error("❌ Invalid credentials. Please try again.")
+
+# Post-login dashboard
+else:
+    st.success(f"✅ Welcome {st.session_state.user}!")
+    if st.button("🔓 Logout"):
+        st.session_state.logged_in = False
+        st.session_state.user = None
+        st.rerun()
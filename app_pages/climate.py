@@ -0,0 +1,41 @@
+import streamlit as st
+import pandas as pd
+
+st.set_page_config(page_title="Module 8 – Climate Risk & Resilience", layout="wide")
+
+st.title("🌾 Module 8: Climate Risk & Resilience")
+
+# ------------------------------
+# STEP 1: User selects country and crop
+# ------------------------------
+countries = ["Philippines", "Suriname"]
+crops = [
+    "Rice", "Corn", "Cassava", "Sweet Potato", "Taro", "Tomato", "Eggplant", "Bell Pepper",
+    "Okra", "String Beans", "Cabbage", "Carrot", "Lettuce", "Onion", "Garlic",
+    "Mung Bean", "Soybean", "Peanut", "Banana", "Pineapple", "Papaya", "Mango",
+    "Coconut", "Coffee"
+]
+
+selected_country = st.selectbox("🌍 Select Country", countries)
+selected_crop = st.selectbox("🌱 Select Crop", crops)
+
+# ------------------------------
+# STEP 2: Climate risk + resilience table
+# ------------------------------
+# Thresholds and actions come from the compiled alert rules (general rules
+# overridden by crop- and country-specific ones)
+import alert_rules
+
+df = pd.DataFrame(alert_rules.risk_table(selected_country, selected_crop))
+
+# ------------------------------
+# STEP 3: Display table
+# ------------------------------
+st.subheader("🌧️ Climate Risks and Organic Resilience Strategies")
+st.dataframe(df, use_container_width=True)
+
+# ------------------------------
+# Optional Next: Connect to Module 9 or alert logic
+# ------------------------------
+st.markdown("---")
+st.markdown("✅ *This data will inform early alerts and suggestions in upcoming modules (Decision Support, Calendar, etc).*")
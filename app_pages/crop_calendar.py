@@ -0,0 +1,53 @@
+import streamlit as st
+
+import crop_kb
+import crop_schedule
+import farm_state
+import gantt
+import render_timing
+
+# --- Session state from Module 1 ---
+farm = farm_state.load()
+selected_crops = farm.selected_crops
+planting_date = farm.planting_date
+farm_name = farm.farm_name
+
+# --- Header ---
+st.title("📅 Smart Crop Calendar")
+st.subheader("🌿 Organic Task Timeline Generator")
+
+st.markdown(f"""
+📋 **Farm Name:** {farm_name}  
+📍 **Planting Date:** {planting_date.strftime('%Y-%m-%d')}  
+🌱 **Crops Selected:** {", ".join(selected_crops) if selected_crops else "None"}
+""")
+
+# --- Generate and Display Calendar ---
+if not selected_crops:
+    st.warning("⚠️ No crops selected. Return to Module 1.")
+else:
+    # Whole schedule built in one vectorized pass over the precomputed task offsets
+    with render_timing.section("Crop Calendar / schedule") as timing:
+        df = crop_schedule.build_schedule(crop_kb.TASK_TABLE, selected_crops, [planting_date])
+        timing.add_rows(len(df))
+
+    if not df.empty:
+        st.success("✅ Crop schedule generated.")
+        st.dataframe(df)
+
+        # All bars drawn in one call; the PNG is cached by schedule hash across reruns
+        with render_timing.section("Crop Calendar / Gantt", caches=[gantt.cache_stats]) as timing:
+            st.image(gantt.render_gantt(
+                df,
+                label=lambda d: d["Crop"].astype(str) + " – " + d["Task"].astype(str),
+                title="🗓️ Organic Crop Gantt Chart",
+                ylabel="Crop – Task",
+                figsize=(10, 6),
+                grid=True,
+            ))
+            timing.add_rows(len(df))
+
+        csv = df.to_csv(index=False).encode("utf-8")
+        st.download_button("📥 Download Timeline (CSV)", csv, "crop_schedule.csv", "text/csv")
+    else:
+        st.warning("⚠️ No timeline data available.")
@@ -0,0 +1,39 @@
+import streamlit as st
+
+import crop_kb
+import farm_state
+
+# --- Session Data from Module 1 ---
+farm = farm_state.load()
+selected_crops = farm.selected_crops
+
+st.title("🧠 AI Decision Support")
+st.subheader("🌿 Smart Organic Crop Recommendations")
+
+if not selected_crops:
+    st.warning("⚠️ Please select crops in Module 1.")
+    st.stop()
+
+# --- Display logic per crop ---
+for crop in selected_crops:
+    st.header(f"🌾 {crop}")
+    data = crop_kb.get(crop)
+
+    if not data or data.practices is None:
+        st.warning("🚫 No data available yet for this crop.")
+        continue
+
+    st.subheader("✅ Good Agricultural Practices (GAP)")
+    for practice in data.practices:
+        st.markdown(f"- {practice}")
+
+    st.subheader("🛡️ Pests & Organic Controls")
+    for pest in data.pests:
+        st.markdown(f"**{pest.name}**")
+        st.markdown(f"• *Symptoms:* {pest.symptoms}")
+        st.markdown(f"• *Organic Control:* {pest.control}")
+        st.markdown("---")
+
+# --- Optional navigation ---
+if st.button("🔁 Back to Module 1"):
+    st.switch_page("app_pages/farm_overview.py")
@@ -0,0 +1,64 @@
+import streamlit as st
+from datetime import datetime
+import random
+
+import farm_state
+import image_store
+
+st.title("🧪 Crop Health Diagnosis")
+st.subheader("📷 Upload Image for Simulated AI Detection")
+
+# --- Load previous session crop info ---
+selected_crops = farm_state.load().selected_crops
+
+if not selected_crops:
+    st.warning("⚠️ No crop selected from Module 1.")
+    st.stop()
+
+selected_crop = st.selectbox("🌿 Select Crop", selected_crops)
+
+uploaded_file = st.file_uploader("📸 Upload image of affected plant", type=["jpg", "jpeg", "png"])
+
+if uploaded_file:
+    # Keep only the stored image's ref in the session, not the upload
+    if st.session_state.get("diagnosis_upload") != uploaded_file.file_id:
+        st.session_state["diagnosis_upload"] = uploaded_file.file_id
+        st.session_state["diagnosis_image"] = image_store.put(uploaded_file)
+    thumbnail = image_store.thumbnail(st.session_state["diagnosis_image"])
+    if thumbnail:
+        st.image(thumbnail, caption="Uploaded Image")
+
+    # --- Simulated AI prediction logic ---
+    diagnosis_options = {
+        "Aloe Vera": [
+            ("Rust Fungus", "Yellow-orange pustules on leaves.", "Apply neem oil + baking soda weekly."),
+            ("Mealybugs", "White cottony masses near base.", "Spray garlic-chili-neem solution every 5 days.")
+        ],
+        "Banana": [
+            ("Black Sigatoka", "Dark streaks on leaves.", "Use potassium bicarbonate + Trichoderma."),
+            ("Weevil Damage", "Tunnels in corm or base.", "Apply neem cake to soil, trap adults.")
+        ],
+        "Papaya": [
+            ("Anthracnose", "Sunken spots on fruits.", "Use copper soap + neem oil."),
+            ("Mealybugs", "White waxy pests on stem.", "Neem + chili + soap foliar spray.")
+        ],
+        "Tomato": [
+            ("Early Blight", "Brown concentric spots on leaves.", "Spray with compost tea + seaweed extract."),
+            ("Aphid Infestation", "Sticky leaves, curled tips.", "Apply neem + garlic spray.")
+        ]
+        # Add more crops with issues here...
+    }
+
+    crop_diagnoses = diagnosis_options.get(selected_crop, [
+        ("Unknown issue", "Symptoms not recognized in current crop.", "Manually inspect or send sample.")
+    ])
+
+    diagnosis = random.choice(crop_diagnoses)
+
+    st.markdown("### 🧬 Simulated Diagnosis Result")
+    st.success(f"**Issue Detected:** {diagnosis[0]}")
+    st.write(f"🔍 **Symptoms:** {diagnosis[1]}")
+    st.write(f"🌿 **Organic Recommendation:** {diagnosis[2]}")
+    st.write(f"🕒 Diagnosis Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+# Optional: save or record diagnosis (future)
@@ -0,0 +1,84 @@
+import streamlit as st
+
+import farm_state
+
+# --- Tropical Country Locations ---
+locations = sorted([
+    # 🌴 Caribbean (including Suriname)
+    "Antigua and Barbuda", "Bahamas", "Barbados", "Belize", "Cuba", "Dominica", "Dominican Republic",
+    "Grenada", "Haiti", "Jamaica", "Saint Kitts and Nevis", "Saint Lucia",
+    "Saint Vincent and the Grenadines", "Trinidad and Tobago", "Suriname",
+
+    # 🌍 Africa (Tropical Belt)
+    "Benin", "Botswana", "Burkina Faso", "Burundi", "Cameroon", "Central African Republic", "Chad",
+
+    "Congo", "Democratic Republic of the Congo", "Equatorial Guinea", "Ethiopia", "Gabon", "Gambia",
+    "Ghana", "Guinea", "Ivory Coast", "Kenya", "Liberia", "Madagascar", "Malawi", "Mali", "Mauritius",
+    "Mozambique", "Namibia", "Niger", "Nigeria", "Rwanda", "Senegal", "Seychelles", "Sierra Leone",
+    "South Sudan", "Sudan", "Tanzania", "Togo", "Uganda", "Zambia", "Zimbabwe",
+
+    # 🌏 ASEAN
+    "Brunei", "Cambodia", "Indonesia", "Laos", "Malaysia", "Myanmar", "Philippines", "Singapore",
+    "Thailand", "Vietnam"
+])
+
+# --- Priority Crops List ---
+crop_options = sorted([
+    "Turmeric", "Ginger", "Lemongrass", "Moringa", "Aloe Vera", "Ashwagandha", "Neem", "Hibiscus", "Butterfly Pea",
+    "Soursop", "Banana", "Papaya", "Dragon Fruit", "Watermelon",
+    "Purple Sweet Potato", "Cassava", "Yellow Malanga", "Groundnuts",
+    "Bitter Gourd", "Tomato", "Eggplant",
+    "Rice", "Corn", "Sugarcane", "Coffee", "Cacao"
+])
+
+# --- Page Config & Title ---
+st.set_page_config(page_title="FarmOps – Farm Dashboard", layout="centered")
+st.title("🌾 FarmOps – Smart Organic Farm Management")
+st.subheader("🚜 Powered by AgriVigor Green Farms Initiative")
+
+# --- Input Section ---
+st.header("📍 Farm Overview")
+
+# Widgets have fixed keys and start from the saved farm only when their key is
+# missing (first visit, or coming back after Streamlit dropped the widget
+# state). Passing defaults from the farm instead would change the widgets' IDs
+# on every edit and reset them.
+farm = farm_state.load()
+seeds = {
+    "overview_location": farm.selected_location if farm.selected_location in locations else locations[0],
+    "overview_farm_size": farm.farm_size,
+    "overview_crops": [crop for crop in farm.selected_crops if crop in crop_options],
+    "overview_planting_date": farm.planting_date,
+}
+for key, value in seeds.items():
+    if key not in st.session_state:
+        st.session_state[key] = value
+
+selected_location = st.selectbox("🌍 Select Your Country", locations, key="overview_location")
+farm_name = f"AgriVigor Green Farm – {selected_location}"
+farm_size = st.number_input("📐 Farm Size (Hectares)", min_value=0.5, max_value=500.0, step=0.5,
+                            key="overview_farm_size")
+selected_crops = st.multiselect("🌿 Crops Grown", crop_options, key="overview_crops")
+planting_date = st.date_input("📅 Select Planting Date", key="overview_planting_date")
+
+# --- Save to Session State ---
+farm_state.save(farm_state.FarmState(
+    selected_location=selected_location,
+    farm_name=farm_name,
+    farm_size=farm_size,
+    selected_crops=selected_crops,
+    planting_date=planting_date,
+))
+
+# --- Display Summary ---
+if selected_crops:
+    st.markdown(f"""
+    ### 🧾 Farm Summary
+    **🏷️ Farm Name:** {farm_name}  
+    **📍 Location:** {selected_location}  
+    **📐 Size:** {farm_size} hectares  
+    **🌿 Crops:** {', '.join(selected_crops)}  
+    **📅 Planting Date:** {planting_date.strftime('%Y-%m-%d')}
+    """)
+else:
+    st.info("Please select at least one crop to proceed to the Smart Crop Calendar.")
@@ -0,0 +1,98 @@
+import io
+
+import streamlit as st
+import pandas as pd
+from matplotlib.figure import Figure
+
+import crop_kb
+import farm_state
+import render_timing
+
+st.set_page_config(page_title="📈 Financial Projection", layout="wide")
+
+# Session state check
+farm = farm_state.load()
+if not farm.selected_crops:
+    st.warning("No crops selected. Please return to Module 1.")
+    st.stop()
+
+# Crop and location
+crop = farm.selected_crops[0]
+location = farm.selected_location or "Tropical Country"
+
+# Use values or default
+data = crop_kb.lookup(crop, "economics", crop_kb.DEFAULT_ECONOMICS)
+
+st.title("📈 Financial Projection Tool")
+st.subheader("Crop Economics Input")
+
+
+# Calculator and projection are fragments: a widget change reruns only the
+# fragment it belongs to, not the rest of the page
+@st.fragment
+@render_timing.timed("Finance / calculator")
+def economics_calculator(crop, data):
+    # Input controls
+    p_yield = st.number_input("Projected Yield (t/ha)", value=float(data.yield_t_ha), step=0.1)
+    p_cost = st.number_input("Production Cost (USD/ha)", value=float(data.cost_usd_ha), step=100.0)
+    p_price = st.number_input("Price (USD/t)", value=float(data.price_usd_t), step=10.0)
+
+    # Calculation
+    revenue = p_yield * p_price
+    profit = revenue - p_cost
+
+    st.markdown("### 💰 Year 1 Summary")
+    st.write(f"**Estimated Revenue:** USD {revenue:,.2f}")
+    st.write(f"**Estimated Profit:** USD {profit:,.2f}")
+
+    price_projection(crop, p_yield, p_cost, p_price)
+
+
+# Chart PNG, cached on the plotted values
+@st.cache_data(max_entries=256, show_spinner=False)
+def projection_chart(crop, years, revenues, profits):
+    fig = Figure()
+    ax = fig.subplots()
+    ax.plot(years, revenues, label="Revenue")
+    ax.plot(years, profits, label="Profit")
+    ax.set_title(f"📈 Revenue and Profit Trend for {crop}")
+    ax.set_ylabel("USD")
+    ax.legend()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+@st.fragment
+@render_timing.timed("Finance / projection")
+def price_projection(crop, p_yield, p_cost, p_price):
+    # Projections
+    growth_rate = st.slider("Annual price increase (%)", 0, 20, 5)
+    projected_data = []
+    price = p_price
+
+    for year in range(1, 4):
+        price *= (1 + growth_rate / 100)
+        revenue = p_yield * price
+        profit = revenue - p_cost
+        projected_data.append({
+            "Year": f"Year {year}",
+            "Price (USD/t)": round(price, 2),
+            "Revenue (USD)": round(revenue, 2),
+            "Profit (USD)": round(profit, 2)
+        })
+
+    df_proj = pd.DataFrame(projected_data)
+    st.markdown("### 📊 3-Year Financial Projection")
+    st.dataframe(df_proj)
+
+    # Chart
+    st.image(projection_chart(
+        crop,
+        tuple(df_proj["Year"]),
+        tuple(df_proj["Revenue (USD)"]),
+        tuple(df_proj["Profit (USD)"]),
+    ))
+
+
+economics_calculator(crop, data)
@@ -0,0 +1,140 @@
+import io
+import sqlite3
+
+import streamlit as st
+import pandas as pd
+from datetime import datetime, timedelta
+
+import farm_state
+import image_store
+import logbook_frame
+import logbook_import
+import logbook_store
+import paging
+import render_timing
+
+st.title("🗂️ Farm Mapping & Activity Logbook")
+
+# --- Pull session state ---
+farm = farm_state.load()
+farm_name = farm.farm_name
+selected_crops = farm.selected_crops
+location = farm.selected_location or "N/A"
+
+if not selected_crops:
+    st.warning("⚠️ Please select crops in Module 1 first.")
+    st.stop()
+
+# --- Logbook (shared SQLite store, see logbook_store.py) ---
+store = logbook_store.get_store()
+
+# --- Activity Log Form ---
+with st.form("activity_log_form"):
+    st.subheader("➕ New Farm Activity Entry")
+
+    log_date = st.date_input("📅 Activity Date", datetime.today())
+    crop = st.selectbox("🌿 Crop", selected_crops)
+    activity_type = st.selectbox("🛠️ Activity Type", logbook_store.ACTIVITIES)
+    description = st.text_area("📝 Description/Notes", "")
+    uploaded_image = st.file_uploader("📸 Optional: Upload Photo", type=["jpg", "jpeg", "png"])
+
+    submitted = st.form_submit_button("✅ Add Entry")
+
+    if submitted:
+        store.add(farm_name, {
+            "Date": log_date.strftime("%Y-%m-%d"),
+            "Crop": crop,
+            "Activity": activity_type,
+            "Notes": description,
+            "ImageName": uploaded_image.name if uploaded_image else "",
+            "ImageRef": image_store.put(uploaded_image) if uploaded_image else "",
+            "Location": location
+        })
+        st.success("✅ Activity logged successfully!")
+
+# --- Bulk Import ---
+with st.expander("📥 Bulk Import from CSV / Excel"):
+    st.caption("Columns: Date, Crop, Activity (required), Notes, ImageName, Location. "
+               "For files too large to upload, run `python logbook_import.py FILE --farm NAME`.")
+    upload = st.file_uploader("Logbook file", type=["csv", "xlsx"], key="logbook_import_file")
+    if upload and st.button("📥 Import", key="logbook_import"):
+        bar = st.progress(0.0, text="Importing…")
+
+        def progress(read, imported, rejected, fraction):
+            bar.progress(min(fraction or 0.0, 1.0),
+                         text=f"Read {read:,} rows · imported {imported:,} · rejected {rejected:,}")
+
+        rejects = io.StringIO()
+        try:
+            result = logbook_import.import_file(farm_name, upload, upload.name, progress=progress, rejects_file=rejects)
+        except ValueError as exc:
+            st.error(f"❌ Import failed: {exc}")
+        except sqlite3.Error as exc:  # raised by the logbook writer, through the chunk futures
+            st.error(f"❌ Import failed while saving to the logbook: {exc}. "
+                     "Rows saved before the error are kept.")
+        else:
+            st.success(f"✅ Imported {result['imported']:,} of {result['read']:,} rows.")
+            if result["rejected"]:
+                st.warning(f"⚠️ {result['rejected']:,} rows rejected"
+                           + (f" (first {len(result['rejects']):,} shown)." if result["rejected"] > len(result["rejects"]) else "."))
+                st.dataframe(result["rejects"], use_container_width=True, hide_index=True)
+                st.download_button("⬇️ Download rejected rows", rejects.getvalue(),
+                                   file_name=f"rejected_{upload.name.rsplit('.', 1)[0]}.csv", mime="text/csv")
+
+# --- Display Logbook ---
+# Filters rerun only this fragment; adding an entry reruns the page
+@st.fragment
+@render_timing.timed("Logbook / view")
+def logbook_view(selected_crops):
+    st.subheader("📖 View Farm Logbook")
+
+    logs = logbook_frame.get(farm_name)
+    logs.refresh()
+    if not logs.size:
+        st.info("No activities logged yet.")
+    else:
+        crop_col, activity_col = st.columns(2)
+        filter_crops = crop_col.multiselect("🔍 Filter by Crop", selected_crops, placeholder="All crops")
+        filter_activities = activity_col.multiselect("🛠️ Filter by Activity", logbook_store.ACTIVITIES,
+                                                     placeholder="All activities")
+        today = datetime.today().date()
+        filter_dates = st.date_input("📅 Filter by Date Range", (today - timedelta(days=30), today))
+        search_col, sort_col, order_col = st.columns([3, 2, 1])
+        search = search_col.text_input("🔎 Search Notes")
+        sort = sort_col.selectbox("Sort by", logbook_frame.SORT_COLUMNS)
+        descending = order_col.toggle("Descending", value=True)
+
+        # A range still being picked has only its start date
+        start = filter_dates[0] if filter_dates else None
+        end = filter_dates[1] if len(filter_dates) > 1 else start
+        rows = logs.query(start, end, filter_crops, filter_activities, search.strip(), sort, descending)
+        render_timing.add_rows(logs.size)
+
+        # Only the shown page is turned into a DataFrame and sent to the browser
+        query = (farm_name, tuple(filter_crops), tuple(filter_activities), start, end, search, sort, descending)
+        offset = paging.page_offset("logbook", query)
+        df_filtered = logs.frame(rows[offset:offset + paging.PAGE_SIZE]).drop(columns="id")
+        st.dataframe(df_filtered.drop(columns="ImageRef"), use_container_width=True,
+                     column_config={"Date": st.column_config.DateColumn(format="YYYY-MM-DD")})
+
+        # Photos of the entries on this page, as thumbnails
+        photos = df_filtered[df_filtered["ImageRef"] != ""]
+        if not photos.empty:
+            with st.expander(f"📸 Photos ({len(photos)})"):
+                thumbnails = [(image_store.thumbnail(row.ImageRef), f"{row.Date:%Y-%m-%d} · {row.Crop} · {row.Activity}")
+                              for row in photos.itertuples()]
+                thumbnails = [(path, caption) for path, caption in thumbnails if path]
+                if thumbnails:
+                    st.image([path for path, _ in thumbnails], caption=[caption for _, caption in thumbnails], width=160)
+
+        if len(rows):
+            crops_label = ", ".join(filter_crops) or "All"
+            st.markdown(f"🧾 {len(rows)} entries for {crops_label} from {start} to {end}")
+        paging.pager("logbook", offset, len(df_filtered), len(rows))
+
+
+logbook_view(selected_crops)
+
+# --- Optional Navigation ---
+if st.button("🔙 Return to Dashboard"):
+    st.switch_page("app_pages/farm_overview.py")
@@ -0,0 +1,53 @@
+import streamlit as st
+
+import crop_kb
+import farm_state
+
+st.title("💧 Soil & Irrigation Monitor")
+st.subheader("🌱 Tropical Crop Soil & Water Requirements (Research-Based)")
+
+# Load session data
+selected_crops = farm_state.load().selected_crops
+if not selected_crops:
+    st.warning("⚠️ No crops selected. Please complete Module 1.")
+    st.stop()
+
+selected_crop = st.selectbox("🌿 Choose a crop", selected_crops, key="soil_monitor_crop")
+
+# Input current soil conditions
+soil_ph = st.slider("pH Level", 3.0, 9.0, 6.5, key="soil_ph")
+moisture = st.slider("Soil Moisture (%)", 0, 100, 50, key="soil_moisture")
+organic_matter = st.slider("Organic Matter (%)", 0.0, 10.0, 3.0, key="soil_om")
+soil_texture = st.selectbox("Soil Texture", ["Sandy", "Loamy", "Clay", "Silty"], key="soil_texture")
+
+# Research-based crop data
+params = crop_kb.lookup(selected_crop, "soil")
+if not params:
+    st.info(f"📘 Data for **{selected_crop}** coming soon.")
+    st.stop()
+
+# Evaluate
+ph_ok = params.ph[0] <= soil_ph <= params.ph[1]
+om_ok = params.organic_matter[0] <= organic_matter <= params.organic_matter[1]
+moist_ok = moisture >= params.moisture_min
+
+# Output
+st.markdown("### 🔍 Soil Suitability Analysis")
+st.markdown(f"- **pH {soil_ph}**: {'✅ Optimal' if ph_ok else '⚠️ Adjust'}")
+st.markdown(f"- **Organic Matter {organic_matter}%**: {'✅ Optimal' if om_ok else '⚠️ Increase'}")
+st.markdown(f"- **Moisture {moisture}%**: {'✅ Optimal' if moist_ok else '⚠️ Too Low'}")
+st.markdown(f"- **Texture**: {soil_texture}")
+
+irrig = params.watering[soil_texture]
+st.markdown("### 💧 Irrigation Guidance")
+st.success(f"Water **{selected_crop}** in **{soil_texture} soil** every **{irrig}**")
+
+st.markdown("### 🌿 Organic Soil Care Suggestions")
+if not ph_ok:
+    st.info("➡️ Use lime/ash to raise pH or sulfur-rich compost to lower it.")
+if not om_ok:
+    st.info("➡️ Add compost/vermicompost/manure to boost organic matter.")
+if not moist_ok:
+    st.info("➡️ Mulch (straw/leaves) to retain moisture and improve structure.")
+
+st.success(f"✅ Analysis complete for **{selected_crop}**!")
@@ -0,0 +1,301 @@
+import argparse
+import ast
+import bisect
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from common import ROOT, environment, write_results
+
+# Cold start profile of the Streamlit entry points, run headlessly with
+# streamlit.testing. Every measurement runs in a fresh interpreter:
+#   - import cost of each heavy dependency on top of streamlit
+#   - first render of each entry point (cold imports included)
+#   - time per module section, from a line tracer on the script's top level
+# and the run fails when a budget is exceeded:
+#   python benchmarks/bench_startup.py --render-budget 3000 --import-budget 1500
+
+ENTRY_POINTS = {
+    "app.py": sorted(glob.glob(os.path.join(ROOT, "app_pages", "*.py"))),
+    "farmops.py": [],
+    "farmops_project/app.py": [],
+    "farmops_project/fixed_app.py": [],
+    "farmops_project_v2/app.py": [],
+}
+DEPENDENCIES = ["pandas", "numpy", "matplotlib.pyplot", "folium", "shapely.geometry", "streamlit_folium", "PIL.Image"]
+SECTION_CALLS = {"title", "header", "subheader"}
+SETUP = "(setup)"
+
+
+def _child(*args):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), *args],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    lines = out.stdout.strip().splitlines()
+    if out.returncode or not lines:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{out.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+# --- Section boundaries -----------------------------------------------------
+
+def _section_name(node, fragments):
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return None
+    func = node.value.func
+    args = node.value.args
+    if isinstance(func, ast.Name) and func.id in fragments:
+        return f"{func.id}()"
+    if not (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "st"):
+        return None
+    if not args or not isinstance(args[0], ast.Constant) or not isinstance(args[0].value, str):
+        return None
+    text = args[0].value.strip()
+    if func.attr in SECTION_CALLS or (func.attr == "markdown" and text.startswith("#")):
+        return text.lstrip("#").strip()[:60]
+    return None
+
+
+# [(first line, section name)] of a script: a section starts at a top-level
+# st.title / st.header / st.subheader / "# ..." markdown, or a call to a
+# function defined in the script (the fragments)
+def sections(path):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    fragments = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    bounds = [(0, SETUP)]
+    for node in tree.body:
+        name = _section_name(node, fragments)
+        if name:
+            bounds.append((node.lineno, name))
+    return bounds
+
+
+# Charges wall time between line events of a script's top-level frame to the
+# section the earlier line belongs to; calls made from a line (imports,
+# fragments, rendering) count towards that line.
+class SectionTimer:
+    def __init__(self, paths):
+        self.bounds = {os.path.abspath(p): sections(p) for p in paths}
+        self.starts = {p: [line for line, _ in b] for p, b in self.bounds.items()}
+        self.totals = {}
+        self._last = None  # (path, section, timestamp)
+
+    def _section(self, path, line):
+        return self.bounds[path][bisect.bisect_right(self.starts[path], line) - 1][1]
+
+    def _charge(self, now):
+        if self._last:
+            path, section, since = self._last
+            key = (os.path.relpath(path, ROOT), section)
+            self.totals[key] = self.totals.get(key, 0.0) + now - since
+
+    def _lines(self, frame, event, arg):
+        now = time.perf_counter()
+        self._charge(now)
+        path = frame.f_code.co_filename
+        self._last = (path, self._section(path, frame.f_lineno), now) if event == "line" else None
+        return self._lines
+
+    def _calls(self, frame, event, arg):
+        code = frame.f_code
+        if event == "call" and code.co_name == "<module>" and code.co_filename in self.bounds:
+            return self._lines
+        return None
+
+    def __enter__(self):
+        sys.settrace(self._calls)
+        threading.settrace(self._calls)
+        return self
+
+    def __exit__(self, *exc):
+        sys.settrace(None)
+        threading.settrace(None)
+        self._charge(time.perf_counter())
+        self._last = None
+
+    def report(self):
+        return [
+            {"script": script, "section": section, "ms": seconds * 1000}
+            for (script, section), seconds in self.totals.items()
+        ]
+
+
+# --- Child processes --------------------------------------------------------
+
+def child_import(module):
+    start = time.perf_counter()
+    import streamlit  # noqa: F401  every entry point pays for it anyway
+    base = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        __import__(module)
+    except ImportError as exc:
+        return {"module": module, "error": str(exc)}
+    return {"module": module, "ms": (time.perf_counter() - start) * 1000, "streamlit_ms": base * 1000}
+
+
+def child_render(script, pages, trace, crops):
+    from streamlit.testing.v1 import AppTest
+
+    import farm_state
+
+    path = os.path.join(ROOT, script)
+    timer = SectionTimer([path, *pages]) if trace else None
+    result = {"script": script, "pages": {}}
+
+    # Pages stop early without selected crops, so start from a farm that has some
+    at = AppTest.from_file(path, default_timeout=120)
+    at.session_state[farm_state.KEY] = farm_state.FarmState(selected_crops=crops)
+    at.session_state["selected_crops"] = crops
+    start = time.perf_counter()
+    if timer:
+        with timer:
+            at.run()
+    else:
+        at.run()
+    result["first_render_ms"] = (time.perf_counter() - start) * 1000
+    result["exceptions"] = [e.value for e in at.exception]
+
+    # Multipage apps: first visit of every page, in a session that has not opened it yet
+    for page in pages:
+        at.switch_page(os.path.relpath(page, os.path.dirname(path)))
+        start = time.perf_counter()
+        if timer:
+            with timer:
+                at.run()
+        else:
+            at.run()
+        result["pages"][os.path.relpath(page, ROOT)] = {
+            "first_visit_ms": (time.perf_counter() - start) * 1000,
+            "exceptions": [e.value for e in at.exception],
+        }
+
+    result["loaded"] = [dep for dep in DEPENDENCIES if dep in sys.modules]
+    if timer:
+        result["sections"] = timer.report()
+    return result
+
+
+# --- Parent -----------------------------------------------------------------
+
+def bench_imports(repeat):
+    results = {}
+    for module in DEPENDENCIES:
+        runs = [_child("--child-import", module) for _ in range(repeat)]
+        if "error" in runs[0]:
+            results[module] = {"error": runs[0]["error"]}
+            continue
+        results[module] = {
+            "import_ms": statistics.median(r["ms"] for r in runs),
+            "streamlit_ms": statistics.median(r["streamlit_ms"] for r in runs),
+        }
+    return results
+
+
+def bench_render(script, repeat, crops):
+    pages = ENTRY_POINTS[script]
+    command = ["--crops", ",".join(crops), "--child-render", script, *pages]
+    runs = [_child(*command) for _ in range(repeat)]
+    traced = _child("--trace", *command)
+    result = {
+        "first_render_ms": statistics.median(r["first_render_ms"] for r in runs),
+        "exceptions": runs[0]["exceptions"],
+        "loaded": runs[0]["loaded"],
+        "sections": traced["sections"],
+    }
+    if pages:
+        result["pages"] = {
+            page: {
+                "first_visit_ms": statistics.median(r["pages"][page]["first_visit_ms"] for r in runs),
+                "exceptions": runs[0]["pages"][page]["exceptions"],
+            }
+            for page in runs[0]["pages"]
+        }
+    return result
+
+
+# Budget overruns, and any page that raised during its render (whatever the budgets)
+def check_budgets(results, args):
+    failures = []
+    for module, stats in results["imports"].items():
+        if args.import_budget and stats.get("import_ms", 0) > args.import_budget:
+            failures.append(f"import {module} {stats['import_ms']:.0f}ms > {args.import_budget:.0f}ms")
+    for script, stats in results["entry_points"].items():
+        for error in stats["exceptions"]:
+            failures.append(f"{script} raised: {error}")
+        for page, page_stats in stats.get("pages", {}).items():
+            for error in page_stats["exceptions"]:
+                failures.append(f"{page} raised: {error}")
+        if args.render_budget and stats["first_render_ms"] > args.render_budget:
+            failures.append(f"{script} first render {stats['first_render_ms']:.0f}ms > {args.render_budget:.0f}ms")
+        for page, page_stats in stats.get("pages", {}).items():
+            if args.render_budget and page_stats["first_visit_ms"] > args.render_budget:
+                failures.append(f"{page} first visit {page_stats['first_visit_ms']:.0f}ms > {args.render_budget:.0f}ms")
+        for section in stats["sections"]:
+            if args.section_budget and section["ms"] > args.section_budget:
+                failures.append(f"{section['script']} [{section['section']}] {section['ms']:.0f}ms "
+                                f"> {args.section_budget:.0f}ms")
+    return failures
+
+
+def report(results, top):
+    print("imports (on top of streamlit):")
+    for module, stats in results["imports"].items():
+        print(f"  {module:<20} " + (f"{stats['import_ms']:8.1f} ms" if "import_ms" in stats else stats["error"]))
+    for script, stats in results["entry_points"].items():
+        errors = f"  ({len(stats['exceptions'])} exceptions)" if stats["exceptions"] else ""
+        print(f"{script}: first render {stats['first_render_ms']:.0f} ms{errors}, loads {', '.join(stats['loaded']) or '-'}")
+        for page, page_stats in stats.get("pages", {}).items():
+            errors = f"  ({len(page_stats['exceptions'])} exceptions)" if page_stats["exceptions"] else ""
+            print(f"  page {page:<36} {page_stats['first_visit_ms']:8.1f} ms{errors}")
+        for section in sorted(stats["sections"], key=lambda s: -s["ms"])[:top]:
+            print(f"  {section['ms']:8.1f} ms  {section['script']} [{section['section']}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import and first-render profile of the Streamlit apps")
+    parser.add_argument("--scripts", nargs="*", default=list(ENTRY_POINTS), choices=list(ENTRY_POINTS))
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-process runs per measurement (median)")
+    parser.add_argument("--render-budget", type=float, help="max first render / first page visit (ms)")
+    parser.add_argument("--import-budget", type=float, help="max import cost of one dependency (ms)")
+    parser.add_argument("--section-budget", type=float, help="max time of one traced section (ms)")
+    parser.add_argument("--crops", default="Tomato,Rice,Cacao", help="crops selected for the session")
+    parser.add_argument("--top", type=int, default=8, help="slowest sections to print per entry point")
+    parser.add_argument("--output", help="write JSON results here")
+    parser.add_argument("--child-import", help=argparse.SUPPRESS)
+    parser.add_argument("--child-render", nargs="+", help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_import:
+        print(json.dumps(child_import(args.child_import)))
+        return 0
+    if args.child_render:
+        script, *pages = args.child_render
+        print(json.dumps(child_render(script, pages, args.trace, args.crops.split(","))))
+        return 0
+
+    results = {
+        "environment": environment(),
+        "imports": bench_imports(args.repeat),
+        "entry_points": {script: bench_render(script, args.repeat, args.crops.split(",")) for script in args.scripts},
+    }
+    report(results, args.top)
+    if args.output:
+        write_results(args.output, results)
+
+    failures = check_budgets(results, args)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
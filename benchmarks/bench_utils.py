@@ -0,0 +1,182 @@
+import argparse
+import copy
+import json
+import sys
+import tempfile
+import time
+
+from common import environment, load_fixture, measure, percentiles, write_results
+
+import forecast_store
+import stub_server
+import utils
+import weather_risk
+
+# Replays the recorded OpenWeather / Nominatim fixtures through the local stub
+# server and reports latency percentiles, throughput and cache hit rates for
+# utils.py. Results are written as JSON so runs can be compared across releases:
+#   python benchmarks/bench_utils.py --output bench.json [--baseline previous.json]
+
+
+def summarize(samples, items_per_call=1):
+    total = sum(samples)
+    stats = percentiles(samples)
+    stats["calls"] = len(samples)
+    stats["throughput_per_s"] = len(samples) * items_per_call / total if total else None
+    return stats
+
+
+# The thresholds of the per-entry loop that weather_risk replaced, as alert rules
+LOOP_RULES = [
+    {"risk": "Humidity Stress", "field": "humidity", "op": ">", "value": 90, "action": ""},
+    {"risk": "Heavy Rain", "field": "rain", "op": ">", "value": 20, "action": ""},
+    {"risk": "Strong Winds", "field": "wind", "op": ">", "value": 15, "action": ""},
+]
+
+
+# That loop, over the full horizon of every forecast
+def loop_alerts(forecasts):
+    results = []
+    for forecast in forecasts:
+        alerts = []
+        for entry in forecast["list"]:
+            if entry["main"]["humidity"] > 90:
+                alerts.append("Humidity Stress")
+            if entry.get("rain", {}).get("3h", 0) > 20:
+                alerts.append("Heavy Rain")
+            if entry["wind"]["speed"] > 15:
+                alerts.append("Strong Winds")
+        results.append(list(set(alerts)))
+    return results
+
+
+def bench_analyze(forecast, args):
+    results = {"analyze_weather.single": summarize(measure(lambda: utils.analyze_weather(forecast), args.iterations))}
+    results["analyze_weather.loop.single"] = summarize(measure(lambda: loop_alerts([forecast]), args.iterations))
+    forecasts = [copy.deepcopy(forecast) for _ in range(args.farms)]
+    convert = measure(lambda: weather_risk.batch_arrays(forecasts), args.repeat)
+    batch = weather_risk.batch_arrays(forecasts)
+    evaluate = measure(lambda: weather_risk.evaluate(batch), args.repeat)
+    results["weather_risk.batch_arrays.bulk"] = summarize(convert, args.farms)
+    results["weather_risk.evaluate.bulk"] = summarize(evaluate, args.farms)
+
+    # End to end against the loop, for the same three thresholds: converting
+    # the JSON on every call, and evaluating forecasts kept in a ForecastStore
+    store = forecast_store.ForecastStore()
+    store.put_many(enumerate(forecasts))
+    loop = measure(lambda: loop_alerts(forecasts), args.repeat)
+    cold = measure(lambda: weather_risk.evaluate(weather_risk.batch_arrays(forecasts), rules=LOOP_RULES), args.repeat)
+    stored = measure(lambda: weather_risk.evaluate(store.arrays(), rules=LOOP_RULES), args.repeat)
+    results["weather_risk.loop.bulk"] = summarize(loop, args.farms)
+    results["weather_risk.end_to_end.bulk"] = summarize(cold, args.farms)
+    results["weather_risk.stored.bulk"] = summarize(stored, args.farms)
+    return results
+
+
+def bench_forecast(base, args):
+    coords = [(5.0 + i * 0.05, -55.0 - i * 0.05) for i in range(args.farms)]
+    utils.forecast_cache.clear()
+
+    cold = measure(lambda: utils.fetch_forecast(5.85, -55.2, "bench", base_url=base, use_cache=False),
+                   args.iterations)
+    before = dict(utils.forecast_cache.stats)
+    warm = measure(lambda: utils.fetch_forecast(5.85, -55.2, "bench", base_url=base), args.iterations)
+    stats = {k: utils.forecast_cache.stats[k] - before[k] for k in before}
+
+    start = time.perf_counter()
+    fetched = sum(data is not None for _, data in
+                  utils.fetch_forecasts(coords, "bench", base_url=base, use_cache=False))
+    bulk_seconds = time.perf_counter() - start
+
+    lookups = stats["fresh_hits"] + stats["stale_hits"] + stats["misses"]
+    return {
+        "fetch_forecast.uncached": summarize(cold),
+        "fetch_forecast.cached": summarize(warm) | {
+            "hit_rate": (stats["fresh_hits"] + stats["stale_hits"]) / lookups if lookups else None,
+        },
+        "fetch_forecasts.bulk": {
+            "farms": len(coords),
+            "ok": fetched,
+            "seconds": bulk_seconds,
+            "throughput_per_s": len(coords) / bulk_seconds,
+        },
+    }
+
+
+def bench_geocode(search_fixture, args):
+    # Mix of gazetteer countries, recorded towns (first a miss, then cached) and unknown places
+    queries = ["Suriname", "Philippines", "Kenya"] + list(search_fixture) + ["Nowhere Creek"]
+    queries = (queries * (args.iterations // len(queries) + 1))[:args.iterations]
+    pending = iter(queries)
+    samples = measure(lambda: utils.get_coords(next(pending)), len(queries))
+    stats = utils.geocode_stats()
+    return {
+        "get_coords.mixed": summarize(samples) | {
+            "hit_rate": stats["hit_rate"],
+            "gazetteer_hits": stats["gazetteer_hits"],
+            "cache_hits": stats["cache_hits"],
+            "misses": stats["misses"],
+        },
+    }
+
+
+# Relative change of each p50 against a previous run; positive means slower
+def compare(results, baseline):
+    changes = {}
+    for name, stats in results["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name, {})
+        if stats.get("p50") and old.get("p50"):
+            changes[name] = stats["p50"] / old["p50"] - 1
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark utils.py against recorded fixtures")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--farms", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated upstream latency (s)")
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--baseline", help="previous JSON results to compare p50 against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 slowdown vs baseline")
+    args = parser.parse_args()
+
+    forecast = load_fixture("openweather_forecast.json")
+    search = load_fixture("nominatim_search.json")
+
+    utils.DATA_DIR = tempfile.mkdtemp(prefix="agrivigor-bench-")
+    utils.limiters["nominatim"].rate = 1000  # local stub; don't pace at Nominatim's 1 req/s
+    stub, base_url = stub_server.start_stub_process(fixtures={"forecast": forecast, "search": search}, delay=args.latency)
+    utils.NOMINATIM_URL = base_url
+
+    benchmarks = {}
+    try:
+        benchmarks.update(bench_analyze(forecast, args))
+        benchmarks.update(bench_forecast(base_url, args))
+        benchmarks.update(bench_geocode(search, args))
+    finally:
+        stub.terminate()
+
+    results = {"environment": environment(), "params": vars(args), "benchmarks": benchmarks}
+    for name, stats in benchmarks.items():
+        line = "  ".join(f"{k}={v:.3f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items())
+        print(f"{name:32} {line}")
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            changes = compare(results, json.load(f))
+        results["baseline_change"] = changes
+        for name, change in changes.items():
+            flag = "REGRESSION" if change > args.tolerance else ""
+            print(f"{name:32} p50 {change:+.1%} {flag}")
+            if change > args.tolerance:
+                status = 1
+
+    if args.output:
+        write_results(args.output, results)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import argparse
+import sys
+import tempfile
+import time
+
+from common import percentiles
+
+import stub_server
+import utils
+
+# Simulates page renders against a stub upstream that turns slow halfway through
+# and checks that p99 render latency stays within the timeout/retry budget.
+
+
+def render_page(farm, base_url):
+    start = time.perf_counter()
+    utils.fetch_forecast(farm, farm, "stub-key", base_url=base_url)
+    utils.get_coords(f"Plot {farm}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="p99 page latency against a slow upstream")
+    parser.add_argument("--farms", type=int, default=20)
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=5.0, help="upstream stall once degraded (s)")
+    parser.add_argument("--read-timeout", type=float, default=0.5)
+    args = parser.parse_args()
+
+    utils.DATA_DIR = tempfile.mkdtemp(prefix="agrivigor-bench-")
+    utils.REQUEST_TIMEOUT = (0.5, args.read_timeout)
+    utils.RETRIES = 1
+    utils.BACKOFF_BASE, utils.BACKOFF_MAX = 0.05, 0.1
+    utils.limiters["nominatim"].rate = 100  # local stub; this run is about timeouts, not the rate limit
+    for breaker in utils.breakers.values():
+        breaker.failure_threshold, breaker.reset_after = 3, 5
+
+    server = stub_server.start_stub_server()
+    utils.NOMINATIM_URL = server.base_url
+
+    # Healthy upstream: warm the caches
+    for farm in range(args.farms):
+        render_page(farm, server.base_url)
+
+    # Degraded upstream: every cached entry is expired, every call goes upstream
+    utils.forecast_cache.fresh_for = utils.forecast_cache.stale_for = 0
+    utils._get_geo_cache().ttl = 0
+    server.delay = args.delay
+    samples = [render_page(i % args.farms, server.base_url) for i in range(args.renders)]
+
+    # Two upstream calls per render, each at most (retries + 1) timeouts plus backoff
+    per_call = (utils.RETRIES + 1) * sum(utils.REQUEST_TIMEOUT) + utils.RETRIES * utils.BACKOFF_MAX
+    budget_ms = 2 * per_call * 1000
+    stats = percentiles(samples)
+    print(f"renders={len(samples)} upstream_delay={args.delay}s budget={budget_ms:.0f}ms")
+    print("latency ms: " + "  ".join(f"{k}={v:.1f}" for k, v in stats.items()))
+    print(f"breakers: {', '.join(f'{b.name}={b.state}' for b in utils.breakers.values())}")
+    print(f"forecast cache: {utils.forecast_cache.stats}")
+    print(f"geocode: {utils.geocode_stats()}")
+    server.shutdown()
+
+    if stats["p99"] > budget_ms:
+        print(f"FAIL: p99 {stats['p99']:.1f}ms exceeds budget {budget_ms:.0f}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
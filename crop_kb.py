@@ -0,0 +1,777 @@
+from types import MappingProxyType
+
+# Crop knowledge base shared by every dashboard.
+# The tables below are the single source of crop facts; they are joined into
+# read-only Crop records once, when the module is first imported, and every
+# Streamlit session in the process reads the same records.
+
+# Other names the dashboards use for the same crop
+ALIASES = {
+    "Neem Tree": "Neem",
+    "Peanut": "Groundnuts",
+    "Groundnut": "Groundnuts",
+    "Roselle": "Hibiscus",
+}
+
+# Task schedule: (task, days after planting)
+TASKS = {
+    "Turmeric": [
+        ("Land Preparation", 0), ("Rhizome Planting", 7), ("Irrigation", 14),
+        ("Mulching", 30), ("Weeding", 60), ("Organic Fertilizer", 90), ("Harvest", 240)
+    ],
+    "Ginger": [
+        ("Soil Prep", 0), ("Rhizome Planting", 5), ("Irrigation", 10),
+        ("Weeding", 30), ("Earthing up", 60), ("Fertilizing", 90), ("Harvest", 210)
+    ],
+    "Lemongrass": [
+        ("Land Prep", 0), ("Transplanting", 7), ("Weeding", 21),
+        ("Fertilization", 30), ("Irrigation", 45), ("Harvest", 150)
+    ],
+    "Moringa": [
+        ("Land Prep", 0), ("Direct Seeding", 7), ("Irrigation", 14),
+        ("Pruning", 60), ("Harvest", 90)
+    ],
+    "Aloe Vera": [
+        ("Land Preparation", 0), ("Transplanting Suckers", 7),
+        ("Irrigation", 14), ("Weeding", 30), ("Organic Fertilizer", 45), ("Harvest", 240)
+    ],
+    "Ashwagandha": [
+        ("Soil Preparation", 0), ("Direct Sowing", 7), ("Weeding", 30),
+        ("Organic Compost", 40), ("Harvest", 180)
+    ],
+    "Neem": [
+        ("Site Selection", 0), ("Seedling Planting", 10), ("Weeding", 30),
+        ("Irrigation (if needed)", 60), ("Harvest", 365)
+    ],
+    "Hibiscus": [
+        ("Land Prep", 0), ("Transplanting", 7), ("Weeding", 21),
+        ("Fertilizing", 40), ("Harvest", 120)
+    ],
+    "Butterfly Pea": [
+        ("Soil Prep", 0), ("Direct Seeding", 5), ("Weeding", 20),
+        ("Staking", 40), ("Harvest", 90)
+    ],
+    "Soursop": [
+        ("Site Prep", 0), ("Seedling Transplanting", 10), ("Weeding", 30),
+        ("Pruning", 90), ("Harvest", 365)
+    ],
+    "Banana": [
+        ("Land Prep", 0), ("Sucker Planting", 7), ("Irrigation", 14),
+        ("Manuring", 30), ("Desuckering", 60), ("Harvest", 300)
+    ],
+    "Papaya": [
+        ("Soil Prep", 0), ("Transplanting", 10), ("Weeding", 20),
+        ("Fertilization", 30), ("Harvest", 240)
+    ],
+    "Dragon Fruit": [
+        ("Land Prep", 0), ("Pole Setup", 7), ("Planting", 14),
+        ("Training", 60), ("Fertilization", 90), ("Harvest", 180)
+    ],
+    "Watermelon": [
+        ("Land Prep", 0), ("Seeding", 5), ("Weeding", 15),
+        ("Irrigation", 20), ("Harvest", 80)
+    ],
+    "Purple Sweet Potato": [
+        ("Soil Prep", 0), ("Vine Planting", 7), ("Irrigation", 14),
+        ("Weeding", 30), ("Harvest", 120)
+    ],
+    "Cassava": [
+        ("Land Prep", 0), ("Stem Planting", 7), ("Irrigation", 21),
+        ("Weeding", 60), ("Harvest", 270)
+    ],
+    "Yellow Malanga": [
+        ("Soil Prep", 0), ("Corm Planting", 5), ("Irrigation", 10),
+        ("Fertilizing", 30), ("Harvest", 180)
+    ],
+    "Groundnuts": [
+        ("Land Prep", 0), ("Sowing", 5), ("Weeding", 20),
+        ("Earthing Up", 35), ("Harvest", 110)
+    ],
+    "Bitter Gourd": [
+        ("Soil Prep", 0), ("Direct Sowing", 5), ("Staking", 20),
+        ("Weeding", 25), ("Harvest", 80)
+    ],
+    "Tomato": [
+        ("Nursery Prep", 0), ("Transplanting", 21), ("Staking", 30),
+        ("Fertilizing", 40), ("Harvest", 90)
+    ],
+    "Eggplant": [
+        ("Nursery Setup", 0), ("Transplanting", 21), ("Weeding", 30),
+        ("Organic Fertilizer", 45), ("Harvest", 100)
+    ],
+    "Rice": [
+        ("Land Prep", 0), ("Sowing", 7), ("Weeding", 30),
+        ("Irrigation", 45), ("Harvest", 120)
+    ],
+    "Corn": [
+        ("Land Prep", 0), ("Direct Sowing", 5), ("Weeding", 20),
+        ("Earthing", 40), ("Harvest", 100)
+    ],
+    "Sugarcane": [
+        ("Soil Prep", 0), ("Setts Planting", 10), ("Irrigation", 30),
+        ("Earthing Up", 60), ("Harvest", 365)
+    ],
+    "Coffee": [
+        ("Land Prep", 0), ("Seedling Transplanting", 14), ("Shading", 30),
+        ("Pruning", 90), ("Harvest", 540)
+    ],
+    "Cacao": [
+        ("Nursery Setup", 0), ("Field Transplant", 60), ("Mulching", 90),
+        ("Canopy Management", 120), ("Harvest", 540)
+    ],
+}
+
+# Good agricultural practices and organic pest / disease controls
+GUIDELINES = {
+    "Turmeric": {
+        "GAP": [
+            "Use disease-free rhizomes, apply crop rotation with legumes, maintain 30 cm spacing, and mulch to conserve moisture and suppress weeds.",
+        ],
+        "Pests & Diseases": {
+            "Shoot borer": {
+                "Symptoms": "Shoot borer",
+                "Control": "Spray neem oil 0.5% every 10 days"
+            },
+            "Rhizome rot": {
+                "Symptoms": "N/A",
+                "Control": "Use Trichoderma harzianum powder in soil at planting"
+            },
+        }
+    },
+    "Ginger": {
+        "GAP": [
+            "Use raised beds, organic mulch, disease-free seed rhizomes, and follow 2–3 year rotation",
+            "Apply neem cake and biocontrol agents regularly.",
+        ],
+        "Pests & Diseases": {
+            "Shoot borer": {
+                "Symptoms": "Shoot borer",
+                "Control": "Apply neem seed kernel extract 5% at 15-day interval"
+            },
+            "Soft rot": {
+                "Symptoms": "N/A",
+                "Control": "Apply Trichoderma viride and avoid water stagnation"
+            },
+        }
+    },
+    "Lemongrass": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Leaf blight": {
+                "Symptoms": "N/A",
+                "Control": "Apply garlic oil spray weekly"
+            },
+            "Rust": {
+                "Symptoms": "N/A",
+                "Control": "Use compost tea and neem extract"
+            },
+        }
+    },
+    "Moringa": {
+        "GAP": [
+            "Plant on raised beds, prune regularly to encourage branching, interplant with legumes, and use compost during flowering.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Spray neem oil or soapy water"
+            },
+            "Caterpillars": {
+                "Symptoms": "N/A",
+                "Control": "Use Bacillus thuringiensis (Bt)"
+            },
+        }
+    },
+    "Aloe Vera": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Ashwagandha": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Neem": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Hibiscus": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Butterfly Pea": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Soursop": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Banana": {
+        "GAP": [
+            "Select healthy suckers, use banana circles with compost pits, manage irrigation, interplant with legumes, and remove old infected leaves.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Papaya": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Damping off": {
+                "Symptoms": "Damping off",
+                "Control": "Seed treatment with Trichoderma + compost"
+            },
+            "Papaya mealybug": {
+                "Symptoms": "N/A",
+                "Control": "Apply neem oil and release parasitoid wasps"
+            },
+        }
+    },
+    "Dragon Fruit": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Watermelon": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Purple Sweet Potato": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Cassava": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Yellow Malanga": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Groundnuts": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Bitter Gourd": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Tomato": {
+        "GAP": [
+            "Use resistant varieties, rotate with non-solanaceous crops, install drip irrigation, apply compost + neem cake, and prune lower leaves.",
+        ],
+        "Pests & Diseases": {
+            "Leaf miner": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil and sticky traps"
+            },
+            "Blight": {
+                "Symptoms": "N/A",
+                "Control": "Garlic+ginger+onion extract foliar spray"
+            },
+        }
+    },
+    "Eggplant": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Damping off": {
+                "Symptoms": "N/A",
+                "Control": "Soil drench with neem and Trichoderma"
+            },
+            "Fruit and shoot borer": {
+                "Symptoms": "N/A",
+                "Control": "Use pheromone traps + neem oil"
+            },
+        }
+    },
+    "Rice": {
+        "GAP": [
+            "Adopt SRI (System of Rice Intensification), maintain shallow water, transplant young seedlings, and use compost + azolla green manure.",
+        ],
+        "Pests & Diseases": {
+            "Stem borer": {
+                "Symptoms": "N/A",
+                "Control": "Use pheromone traps and neem leaf extract"
+            },
+            "Brown spot": {
+                "Symptoms": "N/A",
+                "Control": "Apply cow dung ash or potash foliar spray"
+            },
+        }
+    },
+    "Corn": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Armyworm": {
+                "Symptoms": "N/A",
+                "Control": "Spray neem seed extract 3%"
+            },
+            "Corn borer": {
+                "Symptoms": "N/A",
+                "Control": "Release Trichogramma egg parasitoids"
+            },
+        }
+    },
+    "Sugarcane": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Coffee": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+    "Cacao": {
+        "GAP": [
+            "Use certified organic seed/planting material, maintain proper spacing, apply composted manure, rotate crops annually, and scout weekly.",
+        ],
+        "Pests & Diseases": {
+            "Aphids": {
+                "Symptoms": "N/A",
+                "Control": "Neem oil + soap spray"
+            },
+            "Fungal leaf spot": {
+                "Symptoms": "N/A",
+                "Control": "Spray baking soda + water weekly"
+            },
+        }
+    },
+}
+
+# Soil and water needs: pH range, organic matter % range, minimum moisture %
+# and watering interval by soil texture
+SOIL = {
+    "Banana":     {"pH":(6.0,7.5),"OM":(4,6),"Mthr":65,"W": {"Sandy":"2‑3d","Loamy":"3‑5d","Clay":"5‑7d","Silty":"4‑6d"}},
+    "Tomato":     {"pH":(5.5,7.0),"OM":(2.5,4),"Mthr":70,"W": {"Sandy":"2‑3d","Loamy":"3‑4d","Clay":"4‑5d","Silty":"3‑4d"}},
+    "Papaya":     {"pH":(6.0,7.0),"OM":(3,5),"Mthr":60,"W": {"Sandy":"4‑6d","Loamy":"7‑7d","Clay":"7‑7d","Silty":"5‑7d"}},
+    "Moringa":    {"pH":(6.0,7.5),"OM":(1.5,3),"Mthr":50,"W": {"Sandy":"7‑10d","Loamy":"10‑14d","Clay":"14‑18d","Silty":"10‑12d"}},
+    "Pineapple":  {"pH":(4.0,6.0),"OM":(2,4),"Mthr":55,"W": {"Sandy":"5‑7d","Loamy":"7‑10d","Clay":"10‑14d","Silty":"7‑10d"}},
+    "Cassava":    {"pH":(5.0,6.5),"OM":(1.5,2.5),"Mthr":60,"W": {"Sandy":"7‑7d","Loamy":"10‑14d","Clay":"14‑18d","Silty":"12‑14d"}},
+    "Lemongrass": {"pH":(6.0,7.0),"OM":(2,4),"Mthr":50,"W": {"Sandy":"3‑5d","Loamy":"5‑7d","Clay":"7‑10d","Silty":"5‑7d"}},
+    "Ginger":     {"pH":(5.5,6.5),"OM":(3,5),"Mthr":70,"W": {"Sandy":"3‑4d","Loamy":"4‑5d","Clay":"5‑7d","Silty":"4‑6d"}},
+    "Turmeric":   {"pH":(6.0,7.0),"OM":(3,5),"Mthr":65,"W": {"Sandy":"4‑5d","Loamy":"5‑6d","Clay":"6‑8d","Silty":"5‑7d"}},
+    "Sweet Potato":{"pH":(5.5,6.5),"OM":(2,4),"Mthr":60,"W": {"Sandy":"7‑10d","Loamy":"10‑14d","Clay":"14‑18d","Silty":"10‑14d"}},
+    "Eggplant":   {"pH":(5.5,6.8),"OM":(2.5,4),"Mthr":65,"W": {"Sandy":"2‑3d","Loamy":"3‑5d","Clay":"5‑7d","Silty":"3‑5d"}},
+    "Chili Pepper":{"pH":(5.5,7.0),"OM":(2,4),"Mthr":60,"W": {"Sandy":"3‑4d","Loamy":"4‑6d","Clay":"6‑8d","Silty":"4‑6d"}},
+    "Watermelon": {"pH":(6.0,7.0),"OM":(2,4),"Mthr":60,"W": {"Sandy":"3‑5d","Loamy":"5‑7d","Clay":"7‑10d","Silty":"5‑7d"}},
+    "Cacao":      {"pH":(5.0,7.5),"OM":(3,6),"Mthr":70,"W": {"Sandy":"7‑7d","Loamy":"7‑10d","Clay":"10‑14d","Silty":"7‑10d"}},
+    "Coffee":     {"pH":(5.0,6.5),"OM":(3,5),"Mthr":65,"W": {"Sandy":"5‑7d","Loamy":"7‑10d","Clay":"10‑14d","Silty":"7‑10d"}},
+    "Rice":       {"pH":(5.5,6.5),"OM":(2,4),"Mthr":80,"W": {"Sandy":"Flooded","Loamy":"Flooded","Clay":"Flooded","Silty":"Flooded"}},
+    "Sugarcane":  {"pH":(6.0,7.0),"OM":(3,6),"Mthr":70,"W": {"Sandy":"4‑6d","Loamy":"6‑8d","Clay":"8‑10d","Silty":"6‑8d"}},
+    "Neem Tree":  {"pH":(6.0,8.0),"OM":(1,3),"Mthr":40,"W": {"Sandy":"14‑21d","Loamy":"21‑30d","Clay":"30‑40d","Silty":"21‑28d"}},
+    "Soursop":    {"pH":(6.0,7.0),"OM":(3,5),"Mthr":70,"W": {"Sandy":"4‑6d","Loamy":"7‑10d","Clay":"10‑14d","Silty":"7‑10d"}},
+    "Groundnuts": {"pH":(5.0,6.5),"OM":(2,4),"Mthr":65,"W": {"Sandy":"4‑6d","Loamy":"6‑8d","Clay":"8‑10d","Silty":"6‑8d"}},
+    "Taro":       {"pH":(5.5,6.5),"OM":(3,5),"Mthr":75,"W": {"Sandy":"Flooded","Loamy":"Flooded","Clay":"Flooded","Silty":"Flooded"}},
+    "Yam":        {"pH":(5.5,6.5),"OM":(2.5,4),"Mthr":70,"W": {"Sandy":"10‑14d","Loamy":"14‑18d","Clay":"18‑21d","Silty":"14‑18d"}}
+}
+
+# Economics per hectare: yield (t/ha), production cost (USD/ha), price (USD/t)
+ECONOMICS = {
+    "Banana": {"yield": 30.0, "cost": 4500.0, "price": 300.0},
+    "Aloe Vera": {"yield": 25.0, "cost": 3000.0, "price": 350.0},
+    "Papaya": {"yield": 35.0, "cost": 3200.0, "price": 280.0},
+    "Neem Tree": {"yield": 10.0, "cost": 1800.0, "price": 200.0},
+    "Ashwagandha": {"yield": 15.0, "cost": 2200.0, "price": 500.0},
+    "Guava": {"yield": 28.0, "cost": 4000.0, "price": 320.0},
+    "Jackfruit": {"yield": 20.0, "cost": 3700.0, "price": 450.0},
+    "Moringa": {"yield": 18.0, "cost": 2000.0, "price": 250.0},
+    "Soursop": {"yield": 22.0, "cost": 3400.0, "price": 400.0},
+    "Turmeric": {"yield": 16.0, "cost": 2900.0, "price": 600.0},
+    "Cassava": {"yield": 28.0, "cost": 3100.0, "price": 200.0},
+    "Pineapple": {"yield": 32.0, "cost": 3600.0, "price": 300.0},
+    "Ginger": {"yield": 20.0, "cost": 3300.0, "price": 550.0},
+    "Sugarcane": {"yield": 80.0, "cost": 5200.0, "price": 100.0},
+    "Taro": {"yield": 24.0, "cost": 2700.0, "price": 220.0},
+    "Breadfruit": {"yield": 18.0, "cost": 3900.0, "price": 340.0},
+    "Coconut": {"yield": 12.0, "cost": 4800.0, "price": 500.0},
+    "Peanut": {"yield": 22.0, "cost": 3100.0, "price": 350.0},
+    "Yam": {"yield": 26.0, "cost": 3300.0, "price": 280.0},
+    "Bitter Gourd": {"yield": 20.0, "cost": 2600.0, "price": 300.0},
+    "Sweet Potato": {"yield": 30.0, "cost": 2800.0, "price": 250.0},
+    "Lemongrass": {"yield": 15.0, "cost": 2100.0, "price": 300.0},
+    "Arrowroot": {"yield": 18.0, "cost": 2900.0, "price": 400.0},
+    "Roselle": {"yield": 14.0, "cost": 2300.0, "price": 450.0},
+    "Chili Pepper": {"yield": 20.0, "cost": 2700.0, "price": 350.0},
+    "Tomato": {"yield": 25.0, "cost": 3000.0, "price": 320.0}
+}
+
+# Days from planting to harvest. The dashboards were written against different
+# references and disagree, so each estimate is kept under its own name.
+CALENDAR_DAYS = {
+    "Turmeric": 240, "Annatto": 180, "Butterfly Pea": 90, "Hibiscus": 100,
+    "Neem": 365, "Moringa": 90, "Aloe Vera": 150, "Ginger": 210, "Ashwagandha": 180,
+    "Lemongrass": 120, "Purple Sweet Potato": 120, "Cassava": 300,
+    "Yellow Malanga": 270, "Groundnuts": 110, "Bitter Gourd": 70,
+    "Tomato": 90, "Eggplant": 100, "Bell Pepper": 90, "Chili Pepper": 120,
+    "Soursop": 365, "Watermelon": 90
+}
+
+GROWTH_DAYS = {
+    "Turmeric": 240,
+    "Moringa": 90,
+    "Tomato": 100,
+    "Cassava": 300,
+    "Butterfly Pea": 75,
+    "Eggplant": 120,
+    "Watermelon": 80,
+    "Ginger": 180,
+    "Bitter Gourd": 100,
+    "Bell Pepper": 120,
+    "Chili Pepper": 120,
+    "Groundnuts": 110,
+    "Lemongrass": 150,
+    "Aloe Vera": 365,
+    "Soursop": 540,
+    "Neem": 730,
+    "Annatto": 360,
+    "Yellow Malanga": 210,
+    "Ashwagandha": 150,
+    "Hibiscus": 120
+}
+
+MATURITY_DAYS = {
+    "Turmeric": 240, "Annatto": 180, "Butterfly Pea": 75, "Hibiscus": 100, "Neem": 365,
+    "Moringa": 90, "Aloe Vera": 240, "Ginger": 210, "Ashwagandha": 150, "Lemongrass": 120,
+    "Purple Sweet Potato": 120, "Cassava": 300, "Yellow Malanga": 270, "Groundnuts": 110,
+    "Bitter Gourd": 90, "Tomato": 90, "Eggplant": 100, "Bell Pepper": 90, "Chili Pepper": 120,
+    "Soursop": 365, "Watermelon": 80
+}
+
+PLANNER_DAYS = {
+    "Turmeric": 270,
+    "Ginger": 240,
+    "Lemongrass": 180,
+    "Moringa": 90,
+    "Aloe Vera": 365,
+    "Ashwagandha": 180,
+    "Neem": 365,
+    "Hibiscus": 150,
+    "Butterfly Pea": 120,
+    "Soursop": 365,
+    "Banana": 300,
+    "Papaya": 270,
+    "Dragon Fruit": 180,
+    "Watermelon": 90,
+    "Purple Sweet Potato": 120,
+    "Cassava": 300,
+    "Yellow Malanga": 240,
+    "Groundnuts": 110,
+    "Bitter Gourd": 90,
+    "Tomato": 90,
+    "Eggplant": 120,
+    "Rice": 120,
+    "Corn": 100,
+    "Sugarcane": 360,
+    "Coffee": 365,
+    "Cacao": 365
+}
+
+# Soil types the crop grows well in
+SOIL_TYPES = {
+    "Rice": ["Clay", "Loam"],
+    "Corn": ["Loam", "Sandy Loam"],
+    "Sugarcane": ["Loamy", "Silty"],
+    "Turmeric": ["Loamy", "Well-drained"],
+    "Ginger": ["Sandy Loam"],
+    "Moringa": ["Sandy", "Loamy"],
+    "Cassava": ["Sandy", "Loam"],
+    "Cacao": ["Loam", "Clay Loam"],
+    "Coffee": ["Volcanic", "Loamy"],
+    "Tomato": ["Loam", "Sandy Loam"],
+    "Banana": ["Loamy", "Well-drained"],
+    "Groundnuts": ["Sandy", "Sandy Loam"],
+    "Dragon Fruit": ["Sandy", "Well-drained"],
+    "Hibiscus": ["Loam", "Sandy Loam"],
+    "Eggplant": ["Loam", "Clay Loam"],
+    "Papaya": ["Well-drained", "Sandy Loam"],
+    "Yellow Malanga": ["Loam", "Clay Loam"],
+    "Butterfly Pea": ["Loam", "Sandy"],
+    "Soursop": ["Loam", "Sandy Loam"]
+}
+
+class _Record:
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Pest(_Record):
+    __slots__ = ("name", "symptoms", "control")
+
+
+class SoilNeeds(_Record):
+    __slots__ = ("ph", "organic_matter", "moisture_min", "watering")
+
+
+class Economics(_Record):
+    __slots__ = ("yield_t_ha", "cost_usd_ha", "price_usd_t")
+
+
+DEFAULT_ECONOMICS = Economics(20.0, 3000.0, 300.0)
+
+
+# One crop. Attributes the source tables have no data for are None.
+class Crop(_Record):
+    __slots__ = (
+        "name", "aliases", "tasks", "practices", "pests", "soil", "economics",
+        "calendar_days", "growth_days", "maturity_days", "planner_days", "soil_types",
+    )
+
+
+def canonical(name):
+    return ALIASES.get(name, name)
+
+
+def _pests(guide):
+    return tuple(Pest(pest, info["Symptoms"], info["Control"]) for pest, info in guide["Pests & Diseases"].items())
+
+
+def _soil(needs):
+    return SoilNeeds(needs["pH"], needs["OM"], needs["Mthr"], MappingProxyType(dict(needs["W"])))
+
+
+def _economics(values):
+    return Economics(values["yield"], values["cost"], values["price"])
+
+
+# Join the tables on canonical crop name, in table order
+def _build():
+    sources = [
+        ("tasks", TASKS, lambda tasks: tuple(map(tuple, tasks))),
+        ("practices", GUIDELINES, lambda guide: tuple(guide["GAP"])),
+        ("pests", GUIDELINES, _pests),
+        ("soil", SOIL, _soil),
+        ("economics", ECONOMICS, _economics),
+        ("calendar_days", CALENDAR_DAYS, int),
+        ("growth_days", GROWTH_DAYS, int),
+        ("maturity_days", MATURITY_DAYS, int),
+        ("planner_days", PLANNER_DAYS, int),
+        ("soil_types", SOIL_TYPES, tuple),
+    ]
+    fields = {}
+    for field, table, convert in sources:
+        for name, value in table.items():
+            fields.setdefault(canonical(name), {})[field] = convert(value)
+
+    aliases = {}
+    for alias, name in ALIASES.items():
+        aliases.setdefault(name, []).append(alias)
+
+    crops = {}
+    for name, values in fields.items():
+        values.update(name=name, aliases=tuple(aliases.get(name, ())))
+        crops[name] = Crop(*(values.get(field) for field in Crop.__slots__))
+    return crops
+
+
+CROPS = MappingProxyType(_build())
+
+
+# Crop record by name or alias, or None
+def get(name):
+    return CROPS.get(canonical(name))
+
+
+# One attribute of a crop by name or alias, or `default` when there is no data
+def lookup(name, attr, default=None):
+    value = getattr(get(name), attr, None)
+    return default if value is None else value
+
+
+# Names of the crops that have `attr` (e.g. "tasks", "soil"), in table order
+def names(attr=None):
+    return [name for name, crop in CROPS.items() if attr is None or getattr(crop, attr) is not None]
+
+
+# {crop: ((task, offset), ...)} for crop_schedule.build_schedule
+TASK_TABLE = MappingProxyType({name: CROPS[name].tasks for name in names("tasks")})
@@ -0,0 +1,57 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+TASK_DAYS = 3  # each task is shown as a 3-day window
+
+
+# Flatten a CROP_TASKS-style dict {crop: [(task, offset), ...]} into arrays:
+# crop index, per-crop (start, length) into the task arrays, task name codes
+# into a sorted vocabulary, and day offsets.
+@lru_cache(maxsize=8)
+def _compile(tasks_key):
+    crops = [crop for crop, _ in tasks_key]
+    lengths = np.array([len(tasks) for _, tasks in tasks_key], dtype=np.intp)
+    starts = np.cumsum(lengths) - lengths
+    names = [task for _, tasks in tasks_key for task, _ in tasks]
+    vocab, task_codes = np.unique(np.array(names, dtype=object), return_inverse=True)
+    offsets = np.array([offset for _, tasks in tasks_key for _, offset in tasks], dtype="timedelta64[D]")
+    return {crop: i for i, crop in enumerate(crops)}, starts, lengths, (vocab, task_codes), offsets
+
+
+def compile_tasks(crop_tasks):
+    return _compile(tuple((crop, tuple(map(tuple, tasks))) for crop, tasks in crop_tasks.items()))
+
+
+# Build the task schedule for every crop x planting date x field in one broadcast.
+# Returns a DataFrame with Crop, Task, Start and End (plus Planting Date / Field
+# when more than one planting date or any field is given), sorted by Start.
+def build_schedule(crop_tasks, crops, planting_dates, fields=None, task_days=TASK_DAYS):
+    index, starts, lengths, (vocab, task_codes), offsets = compile_tasks(crop_tasks)
+    codes = np.array([index[c] for c in crops if c in index], dtype=np.intp)
+    dates = np.array([np.datetime64(d, "D") for d in planting_dates], dtype="datetime64[D]")
+    field_names = np.array(fields if fields else [""], dtype=object)
+
+    # Task rows of the selected crops, in crop order
+    counts = lengths[codes]
+    crop_of_row = np.repeat(codes, counts)
+    task_rows = np.repeat(starts[codes] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+
+    # (tasks x dates x fields) grid, flattened in C order
+    n_tasks, n_dates, n_fields = len(task_rows), len(dates), len(field_names)
+    start = (dates[None, :] + offsets[task_rows][:, None]).repeat(n_fields, axis=1).ravel()
+    per_task = n_dates * n_fields
+
+    columns = {
+        "Crop": pd.Categorical.from_codes(np.repeat(crop_of_row, per_task), categories=list(index)),
+        "Task": pd.Categorical.from_codes(np.repeat(task_codes[task_rows], per_task), categories=vocab),
+        "Start": start,
+        "End": start + np.timedelta64(task_days, "D"),
+    }
+    if n_dates > 1:
+        columns["Planting Date"] = np.tile(dates.repeat(n_fields), n_tasks)
+    if fields:
+        columns["Field"] = np.tile(field_names, n_tasks * n_dates)
+
+    return pd.DataFrame(columns).sort_values("Start", kind="stable")
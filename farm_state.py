@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+import streamlit as st
+
+KEY = "farm"
+
+
+# Farm details entered on the Farm Overview page and read by every other page
+@dataclass
+class FarmState:
+    selected_location: str = ""
+    farm_name: str = "AgriVigor Green Farm"
+    farm_size: float = 0.5
+    selected_crops: list[str] = field(default_factory=list)
+    planting_date: date = field(default_factory=date.today)
+
+
+# This session's farm, created with defaults on first use
+def load() -> FarmState:
+    if KEY not in st.session_state:
+        st.session_state[KEY] = FarmState()
+    return st.session_state[KEY]
+
+
+def save(state: FarmState):
+    st.session_state[KEY] = state
+
+
+# Farms to offer where a page reads the logbook: this session's farm (the key
+# the Logbook page writes under) first, then every other farm with entries
+def logbook_farms(store):
+    own = load().farm_name
+    return [own] + [farm for farm in store.farms() if farm != own]
@@ -1,6 +1,18 @@
+import os
+import sys
+
 import streamlit as st
 import datetime
 
+# Shared modules (crop_kb, ...) live at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import crop_kb
+import farm_state
+import logbook_store
+
 # Dummy data
 farm_name = "AgriVigor Green Farm"
 farm_location = "Suriname - Plot 001"
@@ -9,11 +21,7 @@ start_date = datetime.date(2025, 7, 1)
 end_date = datetime.date(2025, 12, 31)
 total_area = 500  # in hectares
 
-# Dummy metrics
-yield_goal = "50 tons"
-labor_used = "120 labor-days"
-budget_used = "$45,000 / $100,000"
-esg_score = "B+"
+# Dummy conditions
 weather_status = "Mostly Sunny"
 soil_status = "Moist, pH 6.5"
 
@@ -32,11 +40,16 @@ with st.container():
 # Section: Metrics Overview
 with st.container():
     st.subheader("📊 Key Performance Metrics")
+    store = logbook_store.get_store()
+    logbook_farm = st.selectbox("Logbook", farm_state.logbook_farms(store), key="metrics_farm")
+    metrics = store.metrics(logbook_farm)  # the logbook's running aggregates
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("🎯 Yield Goal", yield_goal)
-    col2.metric("👨‍🌾 Labor Used", labor_used)
-    col3.metric("💰 Budget", budget_used)
-    col4.metric("✅ ESG Score", esg_score)
+    col1.metric("📝 Activities This Week", metrics["activities_week"],
+                metrics["activities_week"] - metrics["activities_last_week"])
+    col2.metric("👨‍🌾 Labor Entries This Week", metrics["labor_week"],
+                metrics["labor_week"] - metrics["labor_last_week"])
+    col3.metric("🌱 Input Applications", metrics["inputs"], help=f"Logged at {metrics['input_locations']} location(s)")
+    col4.metric("📒 Logbook Entries", metrics["entries"])
 
 # Section: Current Conditions
 with st.container():
@@ -51,45 +64,15 @@ with st.container():
 
 import pandas as pd
 
-# Dummy crop maturity data in days
-crop_data = {
-    "Turmeric": 270,
-    "Ginger": 240,
-    "Lemongrass": 180,
-    "Moringa": 90,
-    "Aloe Vera": 365,
-    "Ashwagandha": 180,
-    "Neem": 365,
-    "Hibiscus": 150,
-    "Butterfly Pea": 120,
-    "Soursop": 365,
-    "Banana": 300,
-    "Papaya": 270,
-    "Dragon Fruit": 180,
-    "Watermelon": 90,
-    "Purple Sweet Potato": 120,
-    "Cassava": 300,
-    "Yellow Malanga": 240,
-    "Groundnuts": 110,
-    "Bitter Gourd": 90,
-    "Tomato": 90,
-    "Eggplant": 120,
-    "Rice": 120,
-    "Corn": 100,
-    "Sugarcane": 360,
-    "Coffee": 365,
-    "Cacao": 365
-}
-
 st.markdown("---")
 st.header("📅 Smart Crop Calendar")
 
 # Input fields
-selected_crop = st.selectbox("Choose a crop", list(crop_data.keys()))
+selected_crop = st.selectbox("Choose a crop", crop_kb.names("planner_days"))
 planting_date = st.date_input("Select planting date")
 
 if selected_crop and planting_date:
-    maturity_days = crop_data[selected_crop]
+    maturity_days = crop_kb.lookup(selected_crop, "planner_days")
     harvest_date = planting_date + datetime.timedelta(days=maturity_days)
 
     st.success(f"Estimated Harvest Date: **{harvest_date.strftime('%B %d, %Y')}**")
@@ -1,6 +1,20 @@
+import os
+import sys
+
 import streamlit as st
 import datetime
 
+# Shared modules (crop_kb, ...) live at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import crop_kb
+import farm_state
+import geometry_store
+import journal
+import paging
+
 # Dummy data
 farm_name = "AgriVigor Green Farm"
 farm_location = "Suriname - Plot 001"
@@ -51,45 +65,15 @@ with st.container():
 
 import pandas as pd
 
-# Dummy crop maturity data in days
-crop_data = {
-    "Turmeric": 270,
-    "Ginger": 240,
-    "Lemongrass": 180,
-    "Moringa": 90,
-    "Aloe Vera": 365,
-    "Ashwagandha": 180,
-    "Neem": 365,
-    "Hibiscus": 150,
-    "Butterfly Pea": 120,
-    "Soursop": 365,
-    "Banana": 300,
-    "Papaya": 270,
-    "Dragon Fruit": 180,
-    "Watermelon": 90,
-    "Purple Sweet Potato": 120,
-    "Cassava": 300,
-    "Yellow Malanga": 240,
-    "Groundnuts": 110,
-    "Bitter Gourd": 90,
-    "Tomato": 90,
-    "Eggplant": 120,
-    "Rice": 120,
-    "Corn": 100,
-    "Sugarcane": 360,
-    "Coffee": 365,
-    "Cacao": 365
-}
-
 st.markdown("---")
 st.header("📅 Smart Crop Calendar")
 
 # Input fields
-selected_crop = st.selectbox("Choose a crop", list(crop_data.keys()))
+selected_crop = st.selectbox("Choose a crop", crop_kb.names("planner_days"))
 planting_date = st.date_input("Select planting date")
 
 if selected_crop and planting_date:
-    maturity_days = crop_data[selected_crop]
+    maturity_days = crop_kb.lookup(selected_crop, "planner_days")
     harvest_date = planting_date + datetime.timedelta(days=maturity_days)
 
     st.success(f"Estimated Harvest Date: **{harvest_date.strftime('%B %d, %Y')}**")
@@ -163,27 +147,6 @@ suriname_crop_windows = {
 # ... (reuse from earlier code, or ask me if you need them refreshed)
 
 # Input form
-soil_compatibility = {
-    "Rice": ["Clay", "Loam"],
-    "Corn": ["Loam", "Sandy Loam"],
-    "Sugarcane": ["Loamy", "Silty"],
-    "Turmeric": ["Loamy", "Well-drained"],
-    "Ginger": ["Sandy Loam"],
-    "Moringa": ["Sandy", "Loamy"],
-    "Cassava": ["Sandy", "Loam"],
-    "Cacao": ["Loam", "Clay Loam"],
-    "Coffee": ["Volcanic", "Loamy"],
-    "Tomato": ["Loam", "Sandy Loam"],
-    "Banana": ["Loamy", "Well-drained"],
-    "Groundnuts": ["Sandy", "Sandy Loam"],
-    "Dragon Fruit": ["Sandy", "Well-drained"],
-    "Hibiscus": ["Loam", "Sandy Loam"],
-    "Eggplant": ["Loam", "Clay Loam"],
-    "Papaya": ["Well-drained", "Sandy Loam"],
-    "Yellow Malanga": ["Loam", "Clay Loam"],
-    "Butterfly Pea": ["Loam", "Sandy"],
-    "Soursop": ["Loam", "Sandy Loam"]
-}
 with st.form("ai_support"):
     selected_crop = st.selectbox("🌾 Select your crop", list(suriname_crop_windows.keys()))
     soil_type = st.selectbox("🧪 Select your soil type", ["Clay", "Loam", "Sandy", "Sandy Loam", "Volcanic", "Well-drained", "Silty"])
@@ -202,8 +165,9 @@ if submitted:
         st.info(f"👫 Companion Crops: {', '.join(companion_crops[selected_crop])}")
 
     # Soil compatibility
-    if selected_crop in soil_compatibility:
-        if soil_type in soil_compatibility[selected_crop]:
+    soil_types = crop_kb.lookup(selected_crop, "soil_types")
+    if soil_types:
+        if soil_type in soil_types:
             st.success("✅ Soil type is compatible with this crop.")
         else:
             st.warning("⚠️ Soil type is not ideal for this crop. Consider improving soil conditions or crop switching.")
@@ -223,7 +187,6 @@ if submitted:
 
 import folium
 from streamlit_folium import st_folium
-from shapely.geometry import shape
 from datetime import datetime
 
 st.markdown("---")
@@ -236,8 +199,7 @@ Draw(export=True, filename='field.geojson').add_to(m)
 
 map_data = st_folium(m, width=700, height=450, returned_objects=["all_drawings"])
 
-if "field_logs" not in st.session_state:
-    st.session_state["field_logs"] = []
+field_logs_stream = journal.farm_stream("field_logs", farm_state.load().farm_name)
 
 st.subheader("📋 Tag Activity to Drawn Shape")
 
@@ -251,28 +213,26 @@ with st.form("log_form"):
     if submitted:
         if map_data and map_data["all_drawings"]:
             geometry = map_data["all_drawings"][-1]["geometry"]
-            geo_type = geometry["type"]
-            geo_coords = geometry["coordinates"]
 
-            st.session_state["field_logs"].append({
+            journal.append(field_logs_stream, {
                 "Plot": plot_name,
                 "Activity": activity,
                 "Date": str(activity_date),
                 "Notes": notes,
-                "Shape Type": geo_type,
-                "Coordinates": str(geo_coords)
+                "Shape Type": geometry["type"],
+                "Plot ID": geometry_store.add(geometry, name=plot_name)
             })
             st.success("✅ Log entry added with shape.")
         else:
             st.warning("⚠️ Please draw a shape on the map before submitting.")
 
-if st.session_state["field_logs"]:
+field_logs = journal.state(field_logs_stream)
+if field_logs:
     st.subheader("📒 Field Activity Logbook")
-    st.table(st.session_state["field_logs"])
+    paging.paged_table("field_logs", field_logs)
 
 import folium
 from streamlit_folium import st_folium
-from shapely.geometry import shape
 from datetime import datetime
 
 st.markdown("---")
@@ -285,8 +245,7 @@ Draw(export=True, filename='field.geojson').add_to(m)
 
 map_data = st_folium(m, width=700, height=450, returned_objects=["all_drawings"])
 
-if "field_logs" not in st.session_state:
-    st.session_state["field_logs"] = []
+field_logs_stream = journal.farm_stream("field_logs", farm_state.load().farm_name)
 
 st.subheader("📋 Tag Activity to Drawn Shape")
 
@@ -300,22 +259,21 @@ with st.form("log_form"):
     if submitted:
         if map_data and map_data["all_drawings"]:
             geometry = map_data["all_drawings"][-1]["geometry"]
-            geo_type = geometry["type"]
-            geo_coords = geometry["coordinates"]
 
-            st.session_state["field_logs"].append({
+            journal.append(field_logs_stream, {
                 "Plot": plot_name,
                 "Activity": activity,
                 "Date": str(activity_date),
                 "Notes": notes,
-                "Shape Type": geo_type,
-                "Coordinates": str(geo_coords)
+                "Shape Type": geometry["type"],
+                "Plot ID": geometry_store.add(geometry, name=plot_name)
             })
             st.success("✅ Log entry added with shape.")
         else:
             st.warning("⚠️ Please draw a shape on the map before submitting.")
 
-if st.session_state["field_logs"]:
+field_logs = journal.state(field_logs_stream)
+if field_logs:
     st.subheader("📒 Field Activity Logbook")
-    st.table(st.session_state["field_logs"])
+    paging.paged_table("field_logs_2", field_logs)
 
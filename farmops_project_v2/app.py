@@ -1,15 +1,25 @@
+import os
+import sys
+
 import streamlit as st
 import folium
 from streamlit_folium import st_folium
-from shapely.geometry import shape
+
+# Shared modules (farm_state, geometry_store, journal, paging, ...) live at the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import farm_state
+import geometry_store
+import journal
+import paging
 
 st.set_page_config(page_title="FarmOps – Module 3", layout="wide")
 
 st.title("📍 FarmOps Module 3: Farm Mapping & Field Logbook")
 
-# Initialize session state
-if "field_logs" not in st.session_state:
-    st.session_state["field_logs"] = []
+field_logs_stream = journal.farm_stream("mapped_field_logs", farm_state.load().farm_name)
 
 # Step 1: Draw on map
 st.subheader("🗺️ Draw Farm Plot on Map")
@@ -37,23 +47,39 @@ notes = st.text_area("📝 Notes or Activity Description", key="log_notes")
 if st.button("➕ Add Field Log", key="add_log_btn"):
     if map_data.get("last_active_drawing"):
         geom = map_data["last_active_drawing"]["geometry"]
-        geom_type = geom["type"]
-        coords = geom["coordinates"]
 
         log_entry = {
             "Crop": crop,
             "Notes": notes,
-            "Shape Type": geom_type,
-            "Coordinates": str(coords)
+            "Shape Type": geom["type"],
+            "Plot ID": geometry_store.add(geom, name=crop)
         }
 
-        st.session_state["field_logs"].append(log_entry)
+        journal.append(field_logs_stream, log_entry)
         st.success("✅ Field log added successfully!")
     else:
         st.warning("⚠️ Please draw a shape on the map before submitting.")
 
 # Step 3: Display logbook
-if st.session_state["field_logs"]:
+field_logs = journal.state(field_logs_stream)
+if field_logs:
     st.subheader("📒 Field Activity Logbook")
-    st.table(st.session_state["field_logs"])
+    paging.paged_table("field_logs", field_logs)
 
+
+# Step 4: Logs of the plot at the last clicked map point
+clicked = map_data.get("last_clicked")
+if clicked and field_logs:
+    st.subheader("📍 Plot at Clicked Point")
+    plot_ids = geometry_store.at(clicked["lng"], clicked["lat"])
+    if not plot_ids:
+        nearest = geometry_store.nearest(clicked["lng"], clicked["lat"])
+        if nearest:
+            st.caption(f"No plot here; showing the nearest one ({nearest[1]:.4f}° away).")
+            plot_ids = [nearest[0]]
+    logs = [log for log in field_logs if log.get("Plot ID") in plot_ids]
+    if logs:
+        # A different subset per plot: the plot ids and the log count version it
+        paging.paged_table("clicked_plot_logs", logs, version=(tuple(plot_ids), len(field_logs)))
+    else:
+        st.info("No field logs for this plot.")
@@ -0,0 +1,184 @@
+from datetime import datetime
+
+import numpy as np
+
+import weather_risk
+
+FIELDS = weather_risk.FIELDS
+
+
+def _timestamp(value):
+    if value is None or isinstance(value, (int, np.integer)):
+        return value
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return int(np.datetime64(value, "s").astype(np.int64))
+
+
+# Compact store of 3-hourly forecasts for many farms.
+# Each field is a (farms x slots) typed array; farm rows are filled in place
+# when a forecast is refreshed and the arrays double in size as farms are added.
+# Everything handed out is a NumPy view, never a copy.
+class ForecastStore:
+    def __init__(self, slots=40, capacity=64):
+        self.slots = slots
+        self.farm_ids = []
+        self._rows = {}
+        self._counts = np.zeros(capacity, dtype=np.int16)
+        self._tz = np.zeros(capacity, dtype=np.int32)  # UTC offset of each farm, seconds
+        self._data = {name: self._blank(dtype, capacity) for name, dtype in FIELDS.items()}
+        self._version = 0
+        self._daily = None  # (version, rollups) cache
+
+    def _blank(self, dtype, rows):
+        fill = 0 if dtype is np.int64 else np.nan
+        return np.full((rows, self.slots), fill, dtype=dtype)
+
+    def _grow(self, needed):
+        capacity = len(self._counts)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, dtype in FIELDS.items():
+            grown = self._blank(dtype, capacity)
+            grown[:len(self.farm_ids)] = self._data[name][:len(self.farm_ids)]
+            self._data[name] = grown
+        self._counts = np.resize(self._counts, capacity)
+        self._tz = np.resize(self._tz, capacity)
+
+    def _row(self, farm_id):
+        row = self._rows.get(farm_id)
+        if row is None:
+            row = len(self.farm_ids)
+            self._grow(row + 1)
+            self.farm_ids.append(farm_id)
+            self._rows[farm_id] = row
+        return row
+
+    def __len__(self):
+        return len(self.farm_ids)
+
+    def __contains__(self, farm_id):
+        return farm_id in self._rows
+
+    # Store (or replace) one farm's OpenWeather forecast
+    def put(self, farm_id, weather_data):
+        self.put_many([(farm_id, weather_data)])
+
+    # Store many forecasts with one columnar conversion
+    def put_many(self, items):
+        items = list(items)
+        if not items:
+            return
+        batch = weather_risk.batch_arrays([data for _, data in items])
+        n = min(batch["dt"].shape[1], self.slots)
+        rows = np.array([self._row(farm_id) for farm_id, _ in items])
+        for name in FIELDS:
+            self._data[name][rows] = self._blank(FIELDS[name], 1)
+            self._data[name][rows, :n] = batch[name][:, :n]
+        self._counts[rows] = np.minimum(np.count_nonzero(batch["dt"], axis=1), self.slots)
+        self._tz[rows] = [((data or {}).get("city") or {}).get("timezone", 0) for _, data in items]
+        self._version += 1
+
+    # All farms as (farms x slots) views; evaluate with weather_risk.evaluate / alert_rules.evaluate
+    def arrays(self):
+        n = len(self.farm_ids)
+        return {name: column[:n] for name, column in self._data.items()}
+
+    def timezone_offsets(self):
+        return self._tz[:len(self.farm_ids)]
+
+    # One farm's forecast as 1-D views, optionally limited to dt in [start, end)
+    def farm(self, farm_id, start=None, end=None):
+        row = self._rows[farm_id]
+        count = int(self._counts[row])
+        dt = self._data["dt"][row, :count]
+        lo = 0 if start is None else int(np.searchsorted(dt, _timestamp(start)))
+        hi = count if end is None else int(np.searchsorted(dt, _timestamp(end)))
+        return {name: column[row, lo:hi] for name, column in self._data.items()}
+
+    # Boolean (farms x slots) mask of slots with dt in [start, end)
+    def window_mask(self, start=None, end=None):
+        dt = self.arrays()["dt"]
+        mask = dt > 0
+        if start is not None:
+            mask &= dt >= _timestamp(start)
+        if end is not None:
+            mask &= dt < _timestamp(end)
+        return mask
+
+    # One farm's forecast as a DataFrame indexed by UTC time, for charting
+    def frame(self, farm_id, start=None, end=None):
+        import pandas as pd
+
+        columns = self.farm(farm_id, start, end)
+        index = pd.to_datetime(columns.pop("dt"), unit="s", utc=True)
+        return pd.DataFrame(columns, index=index)
+
+    # Daily rollups per farm, grouped by the farm's local calendar day (UTC offset
+    # from the forecast response). Returns (farms x days) arrays: date, temp_min,
+    # temp_max, rain, wind_max, humidity_mean and slots, plus the (farms x slots)
+    # day_index of every slot (-1 for empty slots). Cached until the store changes.
+    def daily(self):
+        if self._daily is not None and self._daily[0] == self._version:
+            return self._daily[1]
+
+        data = self.arrays()
+        dt = data["dt"]
+        farms = len(self.farm_ids)
+        valid = dt > 0
+        local_day = (dt + self.timezone_offsets()[:, None]) // 86400
+        first_day = np.where(valid, local_day, np.iinfo(np.int64).max).min(axis=1, initial=np.iinfo(np.int64).max)
+        day_index = np.where(valid, local_day - first_day[:, None], -1).astype(np.int16)
+        days = int(day_index.max()) + 1 if valid.any() else 0
+
+        # Slots are time-ordered within a farm, so each (farm, day) is a contiguous run
+        rows, cols = np.nonzero(valid)
+        group = rows * days + day_index[rows, cols]
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]]) if len(group) else np.empty(0, np.intp)
+        present = group[starts]
+
+        def reduce(ufunc, values, fill=np.nan):
+            out = np.full(farms * days, fill, dtype=np.float32)
+            if len(starts):
+                out[present] = ufunc.reduceat(values[rows, cols], starts)
+            return out.reshape(farms, days)
+
+        slots = np.bincount(group, minlength=farms * days).reshape(farms, days)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rollups = {
+                "date": np.where(slots > 0, (first_day[:, None] + np.arange(days)).astype("datetime64[D]"),
+                                 np.datetime64("NaT")),
+                "temp_min": reduce(np.minimum, data["temp"]),
+                "temp_max": reduce(np.maximum, data["temp"]),
+                "rain": reduce(np.add, np.nan_to_num(data["rain"])),
+                "wind_max": reduce(np.maximum, data["wind"]),
+                "humidity_mean": reduce(np.add, data["humidity"]) / slots,
+                "slots": slots,
+                "day_index": day_index,
+            }
+        self._daily = (self._version, rollups)
+        return rollups
+
+    # (farms x slots) mask of the slots in each farm's Nth local calendar day
+    # (0 = today); pass it as `mask` to weather_risk.evaluate / alert_rules.evaluate
+    def day_mask(self, day=0):
+        return self.daily()["day_index"] == day
+
+    # One farm's daily rollups as a DataFrame indexed by local date
+    def daily_frame(self, farm_id):
+        import pandas as pd
+
+        row = self._rows[farm_id]
+        rollups = self.daily()
+        keep = rollups["slots"][row] > 0
+        columns = {
+            name: rollups[name][row][keep]
+            for name in ("temp_min", "temp_max", "rain", "wind_max", "humidity_mean", "slots")
+        }
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(rollups["date"][row][keep], name="date"))
+
+    # Memory held by the arrays, in bytes
+    def nbytes(self):
+        return sum(column.nbytes for column in self._data.values()) + self._counts.nbytes + self._tz.nbytes
@@ -0,0 +1,98 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from matplotlib import cm, dates as mdates
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+
+MAX_LABELLED_ROWS = 80  # beyond this, per-row tick labels are unreadable anyway
+CACHE_SIZE = 64
+BAR_HEIGHT = 0.8
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def _schedule_key(df, labels, start, end, options):
+    digest = hashlib.sha1(repr(options).encode("utf-8"))
+    digest.update(np.asarray(df.index).tobytes())
+    digest.update(pd.util.hash_pandas_object(df[[start, end]], index=False).values.tobytes())
+    digest.update(pd.util.hash_array(np.asarray(labels, dtype=object)).tobytes())
+    return digest.hexdigest()
+
+
+def _draw(labels, starts, ends, color_index, title, xlabel, ylabel, palette, figsize, grid):
+    rows = len(labels)
+    labelled = rows <= MAX_LABELLED_ROWS
+    fig = Figure(figsize=figsize or (10, max(4, 0.3 * rows) if labelled else 12))
+    ax = fig.subplots()
+    left = mdates.date2num(starts)
+    right = mdates.date2num(ends)
+    colors = np.asarray(palette, dtype=object)[color_index % len(palette)]
+
+    # Every bar as one polygon collection: a single artist however long the plan
+    y = np.arange(rows)
+    bottom, top = y - BAR_HEIGHT / 2, y + BAR_HEIGHT / 2
+    verts = np.stack([
+        np.column_stack([left, bottom]), np.column_stack([left, top]),
+        np.column_stack([right, top]), np.column_stack([right, bottom]),
+    ], axis=1)
+    ax.add_collection(PolyCollection(verts, facecolors=list(colors), edgecolors="none"))
+    if rows:
+        ax.set_xlim(left.min() - 1, right.max() + 1)
+    ax.xaxis_date()
+    if labelled:
+        ax.set_yticks(np.arange(rows), labels)
+    else:
+        ax.set_yticks([])
+    ax.set_ylim(-0.5, rows - 0.5)
+    ax.set_xlabel(xlabel)
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    if title:
+        ax.set_title(title)
+    ax.grid(grid)
+    fig.tight_layout()
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    fig.clear()
+    return buffer.getvalue()
+
+
+# Render a schedule DataFrame as a Gantt chart PNG (bytes for st.image).
+# `label` is a column name or a function of the frame returning one label per row.
+# Bar colours cycle through `palette` by the frame's integer index. Rendered images
+# are cached by a hash of the schedule and options, so unchanged plans are free.
+def render_gantt(df, label="Crop", start="Start", end="End", title=None, xlabel="Date",
+                 ylabel=None, palette=None, figsize=None, grid=False):
+    palette = tuple(palette or cm.Set3.colors)
+    labels = label(df) if callable(label) else df[label].astype(str)
+    labels = list(labels)
+    options = (title, xlabel, ylabel, palette, figsize, grid)
+    key = _schedule_key(df, labels, start, end, options)
+
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            cache_stats["hits"] += 1
+            return _cache[key]
+        cache_stats["misses"] += 1
+
+    png = _draw(
+        labels,
+        pd.to_datetime(df[start]).to_numpy(),
+        pd.to_datetime(df[end]).to_numpy(),
+        np.asarray(df.index, dtype=np.int64),
+        title, xlabel, ylabel, palette, figsize, grid,
+    )
+    with _cache_lock:
+        _cache[key] = png
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return png
@@ -0,0 +1,78 @@
+# Approximate country centroids (lat, lon) for the locations offered in app.py.
+# get_coords answers these from memory so common lookups never hit Nominatim.
+COUNTRY_CENTROIDS = {
+    # 🌴 Caribbean (including Suriname)
+    "Antigua and Barbuda": (17.06, -61.80),
+    "Bahamas": (24.25, -76.00),
+    "Barbados": (13.19, -59.54),
+    "Belize": (17.19, -88.50),
+    "Cuba": (21.52, -77.78),
+    "Dominica": (15.41, -61.37),
+    "Dominican Republic": (18.74, -70.16),
+    "Grenada": (12.12, -61.68),
+    "Haiti": (18.97, -72.29),
+    "Jamaica": (18.11, -77.30),
+    "Saint Kitts and Nevis": (17.36, -62.78),
+    "Saint Lucia": (13.91, -60.98),
+    "Saint Vincent and the Grenadines": (12.98, -61.29),
+    "Trinidad and Tobago": (10.69, -61.22),
+    "Suriname": (3.92, -56.03),
+
+    # 🌍 Africa (Tropical Belt)
+    "Benin": (9.31, 2.32),
+    "Botswana": (-22.33, 24.68),
+    "Burkina Faso": (12.24, -1.56),
+    "Burundi": (-3.37, 29.92),
+    "Cameroon": (7.37, 12.35),
+    "Central African Republic": (6.61, 20.94),
+    "Chad": (15.45, 18.73),
+    "Congo": (-0.23, 15.83),
+    "Democratic Republic of the Congo": (-4.04, 21.76),
+    "Equatorial Guinea": (1.65, 10.27),
+    "Ethiopia": (9.15, 40.49),
+    "Gabon": (-0.80, 11.61),
+    "Gambia": (13.44, -15.31),
+    "Ghana": (7.95, -1.02),
+    "Guinea": (9.95, -9.70),
+    "Ivory Coast": (7.54, -5.55),
+    "Kenya": (-0.02, 37.91),
+    "Liberia": (6.43, -9.43),
+    "Madagascar": (-18.77, 46.87),
+    "Malawi": (-13.25, 34.30),
+    "Mali": (17.57, -4.00),
+    "Mauritius": (-20.35, 57.55),
+    "Mozambique": (-18.67, 35.53),
+    "Namibia": (-22.96, 18.49),
+    "Niger": (17.61, 8.08),
+    "Nigeria": (9.08, 8.68),
+    "Rwanda": (-1.94, 29.87),
+    "Senegal": (14.50, -14.45),
+    "Seychelles": (-4.68, 55.49),
+    "Sierra Leone": (8.46, -11.78),
+    "South Sudan": (6.88, 31.31),
+    "Sudan": (12.86, 30.22),
+    "Tanzania": (-6.37, 34.89),
+    "Togo": (8.62, 0.82),
+    "Uganda": (1.37, 32.29),
+    "Zambia": (-13.13, 27.85),
+    "Zimbabwe": (-19.02, 29.15),
+
+    # 🌏 ASEAN
+    "Brunei": (4.54, 114.73),
+    "Cambodia": (12.57, 104.99),
+    "Indonesia": (-0.79, 113.92),
+    "Laos": (19.86, 102.50),
+    "Malaysia": (4.21, 101.98),
+    "Myanmar": (21.91, 95.96),
+    "Philippines": (12.88, 121.77),
+    "Singapore": (1.35, 103.82),
+    "Thailand": (15.87, 100.99),
+    "Vietnam": (14.06, 108.28),
+}
+
+# Lookup table keyed by normalized name
+_BY_KEY = {name.lower(): coords for name, coords in COUNTRY_CENTROIDS.items()}
+
+
+def lookup(location):
+    return _BY_KEY.get(location.strip().lower())
@@ -0,0 +1,149 @@
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+import utils
+
+# Drawn farm plots, kept as WKB in SQLite and indexed in memory with a shapely
+# STRtree. Field logs keep only the plot id:
+#
+#   plot_id = geometry_store.add(drawing["geometry"], name="Plot A")
+#   geometry_store.at(lon, lat)          # ids of the plots containing the point
+#   geometry_store.nearest(lon, lat)     # (id, distance) of the closest plot
+#   geometry_store.in_bbox(minx, miny, maxx, maxy)
+#
+# An STRtree cannot be added to, so plots added since it was built are checked
+# directly (vectorised) until there are REBUILD_AFTER of them; the tree is then
+# rebuilt. Coordinates are lon / lat degrees and distances are planar degrees.
+
+REBUILD_AFTER = 256
+
+
+class GeometryStore:
+    def __init__(self, path=None, rebuild_after=REBUILD_AFTER):
+        self.path = path or utils.data_path("plots.sqlite")
+        self.rebuild_after = rebuild_after
+        self.stats = {"plots": 0, "builds": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._last_id = 0
+        # (ids, geometries, tree over the first `built` of them, built), swapped as a whole
+        self._index = (np.empty(0, dtype=np.int64), np.empty(0, dtype=object), None, 0)
+
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS plots ("
+                "id INTEGER PRIMARY KEY, name TEXT NOT NULL DEFAULT '', "
+                "wkb BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    # One connection per thread
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Store a GeoJSON geometry (dict) or shapely geometry; returns its plot id.
+    # Self-intersecting drawings are repaired first.
+    def add(self, geometry, name=""):
+        geom = geometry if isinstance(geometry, shapely.Geometry) else shape(geometry)
+        if not geom.is_valid:
+            geom = shapely.make_valid(geom)
+        conn = self._conn()
+        with conn:
+            plot_id = conn.execute(
+                "INSERT INTO plots (name, wkb, created_at) VALUES (?, ?, ?)",
+                (name, shapely.to_wkb(geom), time.time()),
+            ).lastrowid
+        return plot_id
+
+    def get(self, plot_id):
+        row = self._conn().execute("SELECT wkb FROM plots WHERE id = ?", (plot_id,)).fetchone()
+        return shapely.from_wkb(row[0]) if row else None
+
+    # Pull in plots added since the last call, by any session or process
+    def refresh(self):
+        with self._lock:
+            rows = self._conn().execute(
+                "SELECT id, wkb FROM plots WHERE id > ? ORDER BY id", (self._last_id,)
+            ).fetchall()
+            ids, geoms, tree, built = self._index
+            if rows:
+                new_ids, wkbs = zip(*rows)
+                ids = np.concatenate([ids, np.array(new_ids, dtype=np.int64)])
+                geoms = np.concatenate([geoms, shapely.from_wkb(np.array(wkbs, dtype=object))])
+                self._last_id = new_ids[-1]
+                self.stats["plots"] = len(ids)
+            if len(ids) - built > self.rebuild_after:
+                tree, built = shapely.STRtree(geoms), len(geoms)
+                self.stats["builds"] += 1
+            self._index = (ids, geoms, tree, built)
+            return self._index
+
+    def _hits(self, geom):
+        ids, geoms, tree, built = self.refresh()
+        hits = tree.query(geom, predicate="intersects") if tree is not None else np.empty(0, dtype=np.intp)
+        recent = np.flatnonzero(shapely.intersects(geoms[built:], geom)) + built
+        return ids[np.sort(np.concatenate([hits, recent]))].tolist()
+
+    # Ids of the plots containing (or touching) the point
+    def at(self, lon, lat):
+        return self._hits(shapely.Point(lon, lat))
+
+    # Ids of the plots intersecting the box
+    def in_bbox(self, minx, miny, maxx, maxy):
+        return self._hits(shapely.box(minx, miny, maxx, maxy))
+
+    # (id, distance) of the plot closest to the point (0 when inside it), or
+    # None when there are no plots or none within `max_distance`
+    def nearest(self, lon, lat, max_distance=None):
+        ids, geoms, tree, built = self.refresh()
+        point = shapely.Point(lon, lat)
+        best = None
+        if tree is not None:
+            found, distances = tree.query_nearest(point, max_distance=max_distance, return_distance=True, all_matches=False)
+            if len(found):
+                best = (int(found[0]), float(distances[0]))
+        if built < len(geoms):
+            distances = shapely.distance(geoms[built:], point)
+            i = int(np.argmin(distances))
+            if (best is None or distances[i] < best[1]) and (max_distance is None or distances[i] <= max_distance):
+                best = (built + i, float(distances[i]))
+        return (int(ids[best[0]]), best[1]) if best else None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+# The process-wide plot store
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = GeometryStore()
+        return _store
+
+
+def add(geometry, name=""):
+    return get_store().add(geometry, name)
+
+
+def at(lon, lat):
+    return get_store().at(lon, lat)
+
+
+def in_bbox(minx, miny, maxx, maxy):
+    return get_store().in_bbox(minx, miny, maxx, maxy)
+
+
+def nearest(lon, lat, max_distance=None):
+    return get_store().nearest(lon, lat, max_distance)
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import utils
+
+# Content-addressed store for field, logbook and diagnosis photos. An image is
+# saved once under the sha256 of its bytes (uploading the same photo twice
+# stores it once) and sessions keep only that hex digest, the "ref". JPEG
+# thumbnails are made in a thread pool as soon as an image is put, and pages
+# show those instead of the multi-megabyte originals:
+#
+#   ref = image_store.put(uploaded_file)
+#   st.image(image_store.thumbnail(ref))
+
+ROOT = utils.data_path("images")
+THUMB_SIZE = 512  # longest side, pixels
+THUMB_WORKERS = 4
+CHUNK = 1 << 20
+
+_pool = ThreadPoolExecutor(max_workers=THUMB_WORKERS, thread_name_prefix="thumbnail")
+_pending = {}  # (ref, size) -> Future of the thumbnail path
+_lock = threading.RLock()  # guards _pending and stats; done callbacks may run inside _schedule
+stats = {"puts": 0, "deduplicated": 0, "thumbnails": 0}
+
+
+def _path(kind, name):
+    return os.path.join(ROOT, kind, name[:2], name)
+
+
+# Path of the original image
+def path(ref):
+    return _path("blobs", ref)
+
+
+def exists(ref):
+    return bool(ref) and os.path.exists(path(ref))
+
+
+# Store an image (bytes or a binary file object such as an UploadedFile) and
+# return its ref. The file is hashed while it is copied, in CHUNK pieces.
+def put(data):
+    if isinstance(data, (bytes, bytearray)):
+        chunks = [bytes(data)]
+    else:
+        data.seek(0)
+        chunks = iter(lambda: data.read(CHUNK), b"")
+
+    os.makedirs(os.path.join(ROOT, "tmp"), exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp = tempfile.mkstemp(dir=os.path.join(ROOT, "tmp"))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                digest.update(chunk)
+                f.write(chunk)
+        ref = digest.hexdigest()
+        target = path(ref)
+        duplicate = os.path.exists(target)
+        with _lock:
+            stats["puts"] += 1
+            stats["deduplicated"] += duplicate
+        if not duplicate:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    _schedule(ref, THUMB_SIZE)
+    return ref
+
+
+def _make_thumbnail(ref, size):
+    from PIL import Image, ImageOps
+
+    target = _path("thumbs", f"{ref}_{size}.jpg")
+    if not os.path.exists(target):
+        os.makedirs(os.path.join(ROOT, "tmp"), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.join(ROOT, "tmp"))
+        try:
+            with os.fdopen(fd, "wb") as f, Image.open(path(ref)) as image:
+                image.draft("RGB", (size, size))  # JPEGs decode straight at 1/2 .. 1/8 scale
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((size, size))
+                image.convert("RGB").save(f, "JPEG", quality=85)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp, target)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        with _lock:
+            stats["thumbnails"] += 1
+    return target
+
+
+def _schedule(ref, size):
+    with _lock:
+        future = _pending.get((ref, size))
+        if future is None:
+            future = _pending[(ref, size)] = _pool.submit(_make_thumbnail, ref, size)
+            future.add_done_callback(lambda _: _forget(ref, size))
+        return future
+
+
+def _forget(ref, size):
+    with _lock:
+        _pending.pop((ref, size), None)
+
+
+# Path of the thumbnail of `ref` (longest side `size`), waiting for it to be
+# made if it is not on disk yet; None when the image is missing or unreadable
+def thumbnail(ref, size=THUMB_SIZE):
+    target = _path("thumbs", f"{ref}_{size}.jpg")
+    if os.path.exists(target):
+        return target
+    if not exists(ref):
+        return None
+    try:
+        return _schedule(ref, size).result()
+    except OSError:  # PIL.UnidentifiedImageError and friends
+        return None
@@ -0,0 +1,167 @@
+import json
+import sqlite3
+import threading
+import time
+
+import utils
+
+# Append-only journal for the farm records that used to live in each
+# session's state (field_logs, field_data, calendar_data), shared by every
+# session and worker process through one SQLite file (WAL mode). Records are
+# kept per farm: one stream per record kind and farm, named by farm_stream().
+#
+# A stream's state is a list of records built by replaying its events:
+#   "append"     data is a record to add
+#   "append_to"  data is {"index": i, "key": k, "item": x}: state[i][k].append(x)
+# Every SNAPSHOT_EVERY events a stream's state is written as a snapshot and
+# the events it covers are deleted (compaction). Each process keeps the
+# state it has built and tails only the events after the last one it saw,
+# so a rebuild costs the snapshot plus the changes since it. state() hands out
+# a copy taken after each replay; callers must treat it as read-only and
+# change a stream only through append().
+#
+#   stream = journal.farm_stream("field_logs", farm_name)
+#   journal.append(stream, {...})
+#   rows = journal.state(stream)
+
+SNAPSHOT_EVERY = 500  # events per stream between snapshots
+
+
+# Stream of one farm's records of a kind, e.g. "field_data:AgriVigor Green Farm – Kenya"
+def farm_stream(kind, farm):
+    return f"{kind}:{farm}"
+
+
+def _append(state, data):
+    state.append(data)
+
+
+# Copy-on-write: the record is replaced, never changed, so lists already
+# handed out by state() keep their contents
+def _append_to(state, data):
+    record = state[data["index"]]
+    state[data["index"]] = {**record, data["key"]: [*record[data["key"]], data["item"]]}
+
+
+OPS = {"append": _append, "append_to": _append_to}
+
+
+class Journal:
+    def __init__(self, path=None, snapshot_every=SNAPSHOT_EVERY):
+        self.path = path or utils.data_path("journal.sqlite")
+        self.snapshot_every = snapshot_every
+        self.stats = {"events_replayed": 0, "snapshots_loaded": 0, "compactions": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # stream -> [state, last seq applied, events applied since the snapshot, copy handed out]
+        self._streams = {}
+
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, stream TEXT NOT NULL, op TEXT NOT NULL, "
+            "data TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS events_stream_seq ON events (stream, seq)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "stream TEXT PRIMARY KEY, seq INTEGER NOT NULL, state TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.commit()
+
+    # One connection per thread
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # Record an event; returns its sequence number. Unknown ops raise
+    # ValueError before anything is written.
+    def append(self, stream, data, op="append"):
+        if op not in OPS:
+            raise ValueError(f"unknown journal op {op!r}")
+        seq = self._conn().execute(
+            "INSERT INTO events (stream, op, data, created_at) VALUES (?, ?, ?, ?)",
+            (stream, op, json.dumps(data, default=str), time.time()),
+        ).lastrowid
+        self.state(stream)
+        if self._streams[stream][2] >= self.snapshot_every:
+            self.compact(stream)
+        return seq
+
+    # The current state of a stream (a list to read, not change), brought up to date with the
+    # events other sessions and processes appended since the last call
+    def state(self, stream):
+        with self._lock:
+            cached = self._streams.get(stream)
+            conn = self._conn()
+            conn.execute("BEGIN")  # snapshot and events from one consistent read
+            try:
+                snapshot = conn.execute("SELECT seq, state FROM snapshots WHERE stream = ?", (stream,)).fetchone()
+                # Start over from the snapshot when there is none cached yet, or
+                # when compaction removed events this process has not seen
+                if cached is None or (snapshot and snapshot[0] > cached[1]):
+                    seq = snapshot[0] if snapshot else 0
+                    cached = self._streams[stream] = [json.loads(snapshot[1]) if snapshot else [], seq, 0, None]
+                    self.stats["snapshots_loaded"] += bool(snapshot)
+                events = conn.execute(
+                    "SELECT seq, op, data FROM events WHERE stream = ? AND seq > ? ORDER BY seq",
+                    (stream, cached[1]),
+                ).fetchall()
+            finally:
+                conn.execute("COMMIT")
+            for seq, op, data in events:
+                OPS[op](cached[0], json.loads(data))
+                cached[1] = seq
+            cached[2] += len(events)
+            self.stats["events_replayed"] += len(events)
+            if events or cached[3] is None:
+                # A new list each time the state changes; earlier ones stay as they were
+                cached[3] = list(cached[0])
+            return cached[3]
+
+    # Write the stream's state as its snapshot and drop the events it covers
+    def compact(self, stream):
+        self.state(stream)
+        with self._lock:
+            state, seq = self._streams[stream][:2]
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                current = conn.execute("SELECT seq FROM snapshots WHERE stream = ?", (stream,)).fetchone()
+                if not current or current[0] < seq:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO snapshots (stream, seq, state, created_at) VALUES (?, ?, ?, ?)",
+                        (stream, seq, json.dumps(state, default=str), time.time()),
+                    )
+                    conn.execute("DELETE FROM events WHERE stream = ? AND seq <= ?", (stream, seq))
+                    self.stats["compactions"] += 1
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._streams[stream][2] = 0
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+# The process-wide journal
+def get():
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = Journal()
+        return _journal
+
+
+def state(stream):
+    return get().state(stream)
+
+
+def append(stream, data, op="append"):
+    return get().append(stream, data, op)
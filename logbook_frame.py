@@ -0,0 +1,176 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import logbook_store
+
+TEXT_COLUMNS = ["Crop", "Activity", "Notes", "ImageName", "Location", "ImageRef"]
+SORT_COLUMNS = ["Date", "Crop", "Activity"]
+INITIAL_CAPACITY = 1024
+SEARCH_CACHE_SIZE = 8  # free-text needles remembered per column
+
+
+# One text column as int32 codes into an append-only list of distinct values
+class _Codes:
+    def __init__(self):
+        self.values = []
+        self.lower = []  # lower-cased values, for the free-text filter
+        self.index = {}
+        self._searches = OrderedDict()  # needle -> bool per value, for the first len() values
+        self._search_lock = threading.Lock()
+
+    def encode(self, strings):
+        local, uniques = pd.factorize(np.asarray(strings, dtype=object))
+        codes = np.empty(len(uniques), dtype=np.int32)
+        for i, value in enumerate(uniques):
+            code = self.index.get(value)
+            if code is None:
+                code = self.index[value] = len(self.values)
+                self.values.append(value)
+                self.lower.append(value.lower())
+            codes[i] = code
+        return codes[local]
+
+    # Alphabetical rank of every code
+    def ranks(self):
+        ranks = np.empty(len(self.values), dtype=np.int32)
+        ranks[np.argsort(np.array(self.lower, dtype=object), kind="stable")] = np.arange(len(ranks), dtype=np.int32)
+        return ranks
+
+    # Boolean table over the codes, True for the given values
+    def table(self, values):
+        table = np.zeros(len(self.values), dtype=bool)
+        table[[self.index[v] for v in values if v in self.index]] = True
+        return table
+
+    # Boolean table over the codes, True where the value contains `needle`
+    # (lower-cased). Kept per needle and extended as values are added.
+    def search(self, needle):
+        with self._search_lock:
+            found = self._searches.pop(needle, np.zeros(0, dtype=bool))
+            lower = self.lower[len(found):]
+            if lower:
+                found = np.concatenate([found, np.fromiter((needle in v for v in lower), dtype=bool, count=len(lower))])
+            self._searches[needle] = found
+            while len(self._searches) > SEARCH_CACHE_SIZE:
+                self._searches.popitem(last=False)
+            return found
+
+
+# A farm's logbook as typed, growable column arrays: datetime64 dates and
+# categorical text columns (codes + distinct values). refresh() appends only
+# the rows added to the store since the last call. `order` holds row positions
+# sorted by (date, id); new rows are slotted in with searchsorted, so the
+# newest-first view never needs a full sort.
+class LogbookFrame:
+    def __init__(self, farm, store=None):
+        self.farm = farm
+        self.store = store or logbook_store.get_store()
+        self.size = 0
+        self.last_id = 0
+        self.ids = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+        self.dates = np.empty(INITIAL_CAPACITY, dtype="datetime64[D]")
+        self.codes = {c: np.empty(INITIAL_CAPACITY, dtype=np.int32) for c in TEXT_COLUMNS}
+        self.categories = {c: _Codes() for c in TEXT_COLUMNS}
+        self.order = np.empty(0, dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def _grow(self, needed):
+        capacity = len(self.ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self.ids = np.resize(self.ids, capacity)
+        self.dates = np.resize(self.dates, capacity)
+        self.codes = {c: np.resize(codes, capacity) for c, codes in self.codes.items()}
+
+    def _append(self, rows):
+        n, start = len(rows), self.size
+        ids, dates, *texts = zip(*rows)
+        self._grow(start + n)
+        self.ids[start:start + n] = ids
+        self.dates[start:start + n] = np.array(dates, dtype="datetime64[D]")
+        for column, values in zip(TEXT_COLUMNS, texts):
+            self.codes[column][start:start + n] = self.categories[column].encode(values)
+
+        # Ids only grow, so (date, id) order within the new rows is by date alone
+        new = np.arange(start, start + n)
+        new = new[np.argsort(self.dates[new], kind="stable")]
+        sorted_dates = self.dates[self.order]
+        slots = np.searchsorted(sorted_dates, self.dates[new], side="right")
+        self.order = np.insert(self.order, slots, new)
+        self.size = start + n
+        self.last_id = int(ids[-1])
+
+    # Pull in entries added to the store since the last refresh
+    def refresh(self):
+        with self._lock:
+            for rows in self.store.since(self.farm, self.last_id):
+                self._append(rows)
+
+    # Row positions matching the filters, sorted by `sort` (one of SORT_COLUMNS;
+    # ties newest first). `start` / `end` are an inclusive date range; `crops` /
+    # `activities` are lists (empty or None means all); `text` is matched
+    # case-insensitively against the notes.
+    def query(self, start=None, end=None, crops=None, activities=None, text=None, sort="Date", descending=True):
+        self.refresh()
+        order = self.order
+        size = len(order)
+        mask = np.ones(size, dtype=bool)
+        if start is not None:
+            mask &= self.dates[:size] >= np.datetime64(start, "D")
+        if end is not None:
+            mask &= self.dates[:size] <= np.datetime64(end, "D")
+        for column, values in (("Crop", crops), ("Activity", activities)):
+            if values:
+                mask &= self.categories[column].table(values)[self.codes[column][:size]]
+        if text:
+            needle = text.lower()
+            notes = self.codes["Notes"][:size]
+            categories = self.categories["Notes"]
+            table = np.zeros(len(categories.values), dtype=bool)
+            table[notes[mask]] = True
+            candidates = np.flatnonzero(table)
+            if len(candidates) * 4 < len(table):
+                # Few distinct notes left after the other filters: test just those
+                table[candidates] = [needle in categories.lower[c] for c in candidates.tolist()]
+            else:
+                table = categories.search(needle)
+            mask &= table[notes]
+        rows = order[mask[order]][::-1]
+        if sort != "Date":
+            ranks = self.categories[sort].ranks()[self.codes[sort][rows]]
+            rows = rows[np.argsort(-ranks if descending else ranks, kind="stable")]
+        elif not descending:
+            rows = rows[::-1]
+        return rows
+
+    # Typed DataFrame of the given row positions (all rows, newest first, by default)
+    def frame(self, rows=None):
+        if rows is None:
+            rows = self.order[::-1]
+        data = {
+            "id": self.ids[rows],
+            "Date": self.dates[rows].astype("datetime64[ns]"),
+        }
+        for column in TEXT_COLUMNS:
+            # Categories limited to the values present, so a page stays cheap
+            used, codes = np.unique(self.codes[column][rows], return_inverse=True)
+            values = self.categories[column].values
+            data[column] = pd.Categorical.from_codes(codes, [values[c] for c in used])
+        return pd.DataFrame(data)
+
+
+_frames = {}
+_frames_lock = threading.Lock()
+
+
+# The process-wide frame of one farm's logbook
+def get(farm):
+    with _frames_lock:
+        if farm not in _frames:
+            _frames[farm] = LogbookFrame(farm)
+        return _frames[farm]
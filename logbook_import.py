@@ -0,0 +1,224 @@
+import argparse
+import csv
+import io
+import os
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+
+import crop_kb
+import logbook_store
+
+# Bulk import of activity logs from CSV / Excel into the logbook store.
+# The file is read a row at a time (csv module, openpyxl read-only mode) and
+# written CHUNK_ROWS at a time, one transaction per chunk, so memory stays flat
+# however big the file is. While one chunk is being written the next one is
+# read and validated.
+#
+#   python logbook_import.py logs.xlsx --farm "AgriVigor Green Farm" --rejects rejects.csv
+
+CHUNK_ROWS = 5000
+REJECTS_KEPT = 1000  # rejected rows kept for display; all of them go to `rejects_file`
+DATE_FORMATS = ["%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d", "%d.%m.%Y"]  # besides ISO dates
+# Accepted column headers (lower-cased) per logbook key
+HEADERS = {
+    "date": "Date", "activity date": "Date",
+    "crop": "Crop",
+    "activity": "Activity", "activity type": "Activity",
+    "notes": "Notes", "note": "Notes", "description": "Notes", "description/notes": "Notes",
+    "imagename": "ImageName", "image": "ImageName", "photo": "ImageName",
+    "location": "Location",
+}
+REQUIRED = ["Date", "Crop", "Activity"]
+
+CROP_NAMES = {name.lower(): name for name in crop_kb.CROPS}
+CROP_NAMES.update({alias.lower(): crop_kb.canonical(alias) for alias in crop_kb.ALIASES})
+ACTIVITY_NAMES = {activity.lower(): activity for activity in logbook_store.ACTIVITIES}
+
+
+def _text(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+# ISO date of a cell, or None. Logs repeat the same few dates, so parsed
+# text is cached.
+def _date(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return _parse_date(_text(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(text):
+    try:
+        return date.fromisoformat(text[:10]).isoformat()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            pass
+    return None
+
+
+# Logbook entry for one row, or (None, reason) when it is rejected
+def validate(values):
+    day = _date(values.get("Date"))
+    if day is None:
+        return None, f"bad date {_text(values.get('Date'))!r}"
+    crop = CROP_NAMES.get(_text(values.get("Crop")).lower())
+    if crop is None:
+        return None, f"unknown crop {_text(values.get('Crop'))!r}"
+    activity = ACTIVITY_NAMES.get(_text(values.get("Activity")).lower())
+    if activity is None:
+        return None, f"unknown activity {_text(values.get('Activity'))!r}"
+    return {
+        "Date": day,
+        "Crop": crop,
+        "Activity": activity,
+        "Notes": _text(values.get("Notes")),
+        "ImageName": _text(values.get("ImageName")),
+        "Location": _text(values.get("Location")),
+    }, None
+
+
+# --- Readers: (rows iterator, fraction-done callable) ---
+
+def _size(binary):
+    try:
+        position = binary.tell()
+        size = binary.seek(0, os.SEEK_END)
+        binary.seek(position)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _csv_rows(binary):
+    size = _size(binary)
+    text = io.TextIOWrapper(binary, encoding="utf-8-sig", newline="")
+
+    def rows():
+        try:
+            yield from csv.reader(text)
+        finally:
+            text.detach()  # leave the caller's file open
+
+    return rows(), (lambda: binary.tell() / size) if size else (lambda: None)
+
+
+def _xlsx_rows(binary):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("Excel import needs openpyxl (pip install openpyxl)") from None
+    workbook = load_workbook(binary, read_only=True, data_only=True)
+    sheet = workbook.active
+    total = sheet.max_row
+    done = [0]
+
+    def rows():
+        try:
+            for row in sheet.iter_rows(values_only=True):
+                done[0] += 1
+                yield row
+        finally:
+            workbook.close()
+
+    return rows(), (lambda: done[0] / total) if total else (lambda: None)
+
+
+def read_rows(binary, name):
+    if name.lower().endswith((".xlsx", ".xlsm")):
+        return _xlsx_rows(binary)
+    if name.lower().endswith((".csv", ".txt")):
+        return _csv_rows(binary)
+    raise ValueError(f"unsupported file type: {name} (use .csv or .xlsx)")
+
+
+# Import the logbook rows of a CSV / XLSX file (a binary file object) for
+# `farm`. The first row is the header; Date, Crop and Activity columns are
+# required. progress(rows read, imported, rejected, fraction or None) is called
+# after every chunk. Rejected rows are returned (the first REJECTS_KEPT) and,
+# when `rejects_file` is given, all written to it as CSV.
+def import_file(farm, binary, name, store=None, chunk_rows=CHUNK_ROWS, progress=None, rejects_file=None):
+    store = store or logbook_store.get_store()
+    rows, fraction = read_rows(binary, name)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("the file is empty")
+    columns = [HEADERS.get(_text(cell).lower()) for cell in header]
+    missing = [key for key in REQUIRED if key not in columns]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+
+    result = {"read": 0, "imported": 0, "rejected": 0, "rejects": []}
+    rejects_writer = csv.writer(rejects_file) if rejects_file else None
+    if rejects_writer:
+        rejects_writer.writerow(["Row", "Reason", *(_text(cell) for cell in header)])
+    chunk, pending = [], None
+
+    def flush():
+        nonlocal chunk, pending
+        if pending:
+            result["imported"] += pending.result()
+        pending = store.submit_chunk(farm, chunk) if chunk else None
+        chunk = []
+
+    for line, row in enumerate(rows, start=2):
+        if not any(cell not in (None, "") for cell in row):
+            continue
+        result["read"] += 1
+        entry, reason = validate({key: cell for key, cell in zip(columns, row) if key})
+        if entry:
+            chunk.append(entry)
+        else:
+            result["rejected"] += 1
+            if len(result["rejects"]) < REJECTS_KEPT:
+                result["rejects"].append({"Row": line, "Reason": reason,
+                                          **{_text(h): _text(c) for h, c in zip(header, row)}})
+            if rejects_writer:
+                rejects_writer.writerow([line, reason, *(_text(cell) for cell in row)])
+        if len(chunk) >= chunk_rows:
+            flush()
+            if progress:
+                progress(result["read"], result["imported"], result["rejected"], fraction())
+    flush()
+    flush()
+    if progress:
+        progress(result["read"], result["imported"], result["rejected"], 1.0)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import activity logs into the farm logbook")
+    parser.add_argument("file", help=".csv or .xlsx with Date, Crop and Activity columns")
+    parser.add_argument("--farm", default="AgriVigor Green Farm")
+    parser.add_argument("--rejects", help="write rejected rows to this CSV")
+    args = parser.parse_args()
+
+    def report(read, imported, rejected, fraction):
+        done = f"{fraction:.0%}" if fraction is not None else "?"
+        print(f"\r{done} read {read}, imported {imported}, rejected {rejected}", end="", file=sys.stderr)
+
+    rejects = open(args.rejects, "w", newline="", encoding="utf-8") if args.rejects else None
+    try:
+        with open(args.file, "rb") as f:
+            result = import_file(args.farm, f, args.file, progress=report, rejects_file=rejects)
+    finally:
+        if rejects:
+            rejects.close()
+    print(file=sys.stderr)
+    print(f"imported {result['imported']} of {result['read']} rows, rejected {result['rejected']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import utils
+
+COLUMNS = ["farm", "date", "crop", "activity", "notes", "image", "location", "image_ref"]
+# Logbook dict keys used by the dashboards, per column. ImageRef is the
+# photo's image_store ref.
+KEYS = {"date": "Date", "crop": "Crop", "activity": "Activity", "notes": "Notes",
+        "image": "ImageName", "location": "Location", "image_ref": "ImageRef"}
+ACTIVITIES = [
+    "Land Preparation", "Sowing/Planting", "Weeding", "Irrigation",
+    "Organic Input Application", "Pest/Disease Monitoring", "Harvesting",
+    "Training/Pruning", "Labor Entry", "Other",
+]
+REQUIRED = ["Date", "Crop", "Activity"]  # keys every entry must have
+LABOR_ACTIVITY = "Labor Entry"
+INPUT_ACTIVITY = "Organic Input Application"
+BATCH_SIZE = 500  # entries per write transaction
+PAGE_SIZE = 50
+
+# Aggregates kept up to date by the writer, in the transaction that inserts
+# the entries: entries per farm / crop / week (Monday) / activity, per farm /
+# location / activity, and per farm / activity
+AGGREGATES = {
+    "logbook_weekly": ("farm", "crop", "week", "activity"),
+    "logbook_fields": ("farm", "location", "activity"),
+    "logbook_totals": ("farm", "activity"),
+}
+# Their first fill from an existing logbook; the week is the Monday on or before the date
+BACKFILL = {
+    "logbook_weekly": "SELECT farm, crop, date(date, '-6 days', 'weekday 1'), activity, COUNT(*), MAX(date) "
+                      "FROM logbook GROUP BY 1, 2, 3, 4",
+    "logbook_fields": "SELECT farm, location, activity, COUNT(*), MAX(date) FROM logbook GROUP BY 1, 2, 3",
+    "logbook_totals": "SELECT farm, activity, COUNT(*), MAX(date) FROM logbook GROUP BY 1, 2",
+}
+
+
+def _day(value):
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return date.fromisoformat(str(value)[:10]).isoformat()  # ValueError for a bad date
+
+
+# Monday of the week holding an ISO date, as an ISO date
+@lru_cache(maxsize=4096)
+def week_of(day):
+    day = date.fromisoformat(_day(day))
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+# Farm activity logbook in SQLite (WAL mode), shared by every session and
+# worker process. Readers never block writers. Appends from all threads go
+# through one writer thread that commits them in batches (group commit), so
+# many concurrent add() calls cost one transaction instead of one each.
+class LogbookStore:
+    def __init__(self, path=None, batch_size=BATCH_SIZE):
+        self.path = path or utils.data_path("logbook.sqlite")
+        self.batch_size = batch_size
+        self.stats = {"entries": 0, "batches": 0}
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS logbook ("
+            "id INTEGER PRIMARY KEY, farm TEXT NOT NULL, date TEXT NOT NULL, "
+            "crop TEXT NOT NULL, activity TEXT NOT NULL, notes TEXT NOT NULL DEFAULT '', "
+            "image TEXT NOT NULL DEFAULT '', location TEXT NOT NULL DEFAULT '', "
+            "created_at REAL NOT NULL, image_ref TEXT NOT NULL DEFAULT '')"
+        )
+        # Databases made before photos were kept
+        if "image_ref" not in [row[1] for row in conn.execute("PRAGMA table_info(logbook)")]:
+            conn.execute("ALTER TABLE logbook ADD COLUMN image_ref TEXT NOT NULL DEFAULT ''")
+        conn.execute("CREATE INDEX IF NOT EXISTS logbook_farm_crop_date ON logbook (farm, crop, date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS logbook_farm_date ON logbook (farm, date)")
+        conn.execute("BEGIN IMMEDIATE")  # one process creates and fills the aggregates
+        for table, key in AGGREGATES.items():
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (table,)).fetchone():
+                continue
+            conn.execute(
+                f"CREATE TABLE {table} ({', '.join(f'{column} TEXT NOT NULL' for column in key)}, "
+                f"entries INTEGER NOT NULL, last_date TEXT NOT NULL, "
+                f"PRIMARY KEY ({', '.join(key)})) WITHOUT ROWID"
+            )
+            conn.execute(f"INSERT INTO {table} {BACKFILL[table]}")
+        conn.commit()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # One read connection per thread
+    def _reader(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- Writes ---
+
+    def _start_writer(self):
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="logbook-writer", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        conn = self._connect()
+        insert = (f"INSERT INTO logbook ({', '.join(COLUMNS)}, created_at) "
+                  f"VALUES ({', '.join('?' * len(COLUMNS))}, ?)")
+        while True:
+            # Queue items are (row, future) for one entry, (rows, future) for a bulk write
+            batch = [self._queue.get()]
+            size = len(batch[0][0]) if isinstance(batch[0][0], list) else 1
+            while size < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+                size += len(item[0]) if isinstance(item[0], list) else 1
+            try:
+                results = self._write(conn, insert, batch)
+            except Exception:  # the writer thread must outlive a failed batch
+                # One bad item must not fail the others: retry each on its own
+                # so only the offending futures get the error
+                results = []
+                for item in batch:
+                    try:
+                        results.append(self._write(conn, insert, [item])[0])
+                    except Exception as exc:
+                        results.append(exc)
+            written = [(item, result) for item, result in zip(batch, results) if not isinstance(result, Exception)]
+            if written:
+                self.stats["entries"] += sum(len(rows) if isinstance(rows, list) else 1 for (rows, _), _ in written)
+                self.stats["batches"] += 1
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    # Insert the queue items of one batch and update the aggregates in one
+    # transaction; returns the result of each item (row id or rows written)
+    def _write(self, conn, insert, batch):
+        with conn:
+            results = [
+                conn.executemany(insert, rows).rowcount if isinstance(rows, list)
+                else conn.execute(insert, rows).lastrowid
+                for rows, _ in batch
+            ]
+            self._aggregate(conn, [row for rows, _ in batch
+                                   for row in (rows if isinstance(rows, list) else [rows])])
+        return results
+
+    # Add a batch of inserted rows to the aggregate tables: counted per key
+    # here, then one upsert per distinct key
+    @staticmethod
+    def _aggregate(conn, rows):
+        counts = {table: Counter() for table in AGGREGATES}
+        last = {table: {} for table in AGGREGATES}
+        for farm, day, crop, activity, _, _, location, *_ in rows:
+            for table, key in (
+                ("logbook_weekly", (farm, crop, week_of(day), activity)),
+                ("logbook_fields", (farm, location, activity)),
+                ("logbook_totals", (farm, activity)),
+            ):
+                counts[table][key] += 1
+                if day > last[table].get(key, ""):
+                    last[table][key] = day
+        for table, key in AGGREGATES.items():
+            conn.executemany(
+                f"INSERT INTO {table} VALUES ({', '.join('?' * (len(key) + 2))}) "
+                f"ON CONFLICT DO UPDATE SET entries = entries + excluded.entries, "
+                f"last_date = max(last_date, excluded.last_date)",
+                [(*k, n, last[table][k]) for k, n in counts[table].items()],
+            )
+
+    # Row tuple for an entry. Raises ValueError, in the caller's thread, when
+    # the farm, Date, Crop or Activity is missing or the date is bad.
+    @staticmethod
+    def _row(farm, entry):
+        missing = [key for key in REQUIRED if not entry.get(key)]
+        if not farm or missing:
+            raise ValueError(f"logbook entry is missing {', '.join(missing or ['the farm'])}")
+        return (farm, *(_day(entry["Date"]) if column == "date" else entry.get(KEYS[column]) or ""
+                        for column in COLUMNS[1:]), time.time())
+
+    # Queue one entry (a logbook dict: Date, Crop, Activity, Notes, ImageName,
+    # Location) for `farm`. Returns a Future resolving to the row id once the
+    # batch holding it is committed; raises ValueError for an incomplete entry.
+    def submit(self, farm, entry):
+        self._start_writer()
+        future = Future()
+        self._queue.put((self._row(farm, entry), future))
+        return future
+
+    # Add one entry and wait until it is committed; returns its id
+    def add(self, farm, entry, timeout=30):
+        return self.submit(farm, entry).result(timeout)
+
+    # Add many entries; waits for all of them and returns their ids
+    def add_many(self, farm, entries, timeout=None):
+        futures = [self.submit(farm, entry) for entry in entries]
+        return [future.result(timeout) for future in futures]
+
+    # Queue a chunk of entries to be written in one transaction (bulk imports).
+    # Returns a Future resolving to the number written; raises ValueError,
+    # before anything is queued, when an entry is incomplete.
+    def submit_chunk(self, farm, entries):
+        self._start_writer()
+        future = Future()
+        self._queue.put(([self._row(farm, entry) for entry in entries], future))
+        return future
+
+    # --- Reads ---
+
+    @staticmethod
+    def _where(farm, crop=None, start=None, end=None):
+        clauses, params = ["farm = ?"], [farm]
+        if crop is not None:
+            clauses.append("crop = ?")
+            params.append(crop)
+        if start is not None:
+            clauses.append("date >= ?")
+            params.append(_day(start))
+        if end is not None:
+            clauses.append("date <= ?")
+            params.append(_day(end))
+        return " AND ".join(clauses), params
+
+    # One page of a farm's entries, newest first, optionally for one crop and an
+    # inclusive date range. `after` is the cursor returned with the previous page.
+    # Returns (entries, cursor for the next page or None).
+    def page(self, farm, crop=None, start=None, end=None, limit=PAGE_SIZE, after=None):
+        where, params = self._where(farm, crop, start, end)
+        if after is not None:
+            where += " AND (date, id) < (?, ?)"
+            params += list(after)
+        rows = self._reader().execute(
+            f"SELECT id, {', '.join(COLUMNS[1:])} FROM logbook WHERE {where} "
+            "ORDER BY date DESC, id DESC LIMIT ?", params + [limit + 1],
+        ).fetchall()
+        more = len(rows) > limit
+        rows = rows[:limit]
+        entries = [
+            {"id": row[0], **{KEYS[column]: value for column, value in zip(COLUMNS[1:], row[1:])}}
+            for row in rows
+        ]
+        cursor = (rows[-1][1], rows[-1][0]) if more else None
+        return entries, cursor
+
+    # Raw rows (id, date, crop, activity, notes, image, location) of a farm added
+    # after row `after_id`, in id order, `size` rows per yielded list
+    def since(self, farm, after_id=0, size=50000):
+        # "+farm" keeps SQLite on the rowid range instead of the farm indexes
+        cursor = self._reader().execute(
+            f"SELECT id, {', '.join(COLUMNS[1:])} FROM logbook WHERE id > ? AND +farm = ? ORDER BY id",
+            (after_id, farm),
+        )
+        while rows := cursor.fetchmany(size):
+            yield rows
+
+    def count(self, farm, crop=None, start=None, end=None):
+        where, params = self._where(farm, crop, start, end)
+        return self._reader().execute(f"SELECT COUNT(*) FROM logbook WHERE {where}", params).fetchone()[0]
+
+    # --- Aggregates (primary key lookups; cost does not grow with the logbook) ---
+
+    # {activity: entries} for a farm
+    def totals(self, farm):
+        rows = self._reader().execute("SELECT activity, entries FROM logbook_totals WHERE farm = ?", (farm,))
+        return dict(rows)
+
+    # {(crop, activity): entries} for the week holding `day`
+    def weekly(self, farm, day):
+        rows = self._reader().execute(
+            "SELECT crop, activity, entries FROM logbook_weekly WHERE farm = ? AND week = ?",
+            (farm, week_of(day)),
+        )
+        return {(crop, activity): entries for crop, activity, entries in rows}
+
+    # {location: (entries, last date)} of one activity for a farm
+    def fields(self, farm, activity=INPUT_ACTIVITY):
+        rows = self._reader().execute(
+            "SELECT location, entries, last_date FROM logbook_fields WHERE farm = ? AND activity = ?",
+            (farm, activity),
+        )
+        return {location: (entries, last_date) for location, entries, last_date in rows}
+
+    # Farms with logbook entries, by name
+    def farms(self):
+        return [farm for farm, in self._reader().execute("SELECT DISTINCT farm FROM logbook_totals ORDER BY farm")]
+
+    # Figures for the dashboards' Key Metrics tiles, as of `today`
+    def metrics(self, farm, today=None):
+        today = today or date.today()
+        this_week = self.weekly(farm, today)
+        last_week = self.weekly(farm, today - timedelta(days=7))
+        inputs = self.fields(farm)
+        return {
+            "entries": sum(self.totals(farm).values()),
+            "activities_week": sum(this_week.values()),
+            "activities_last_week": sum(last_week.values()),
+            "labor_week": sum(n for (_, activity), n in this_week.items() if activity == LABOR_ACTIVITY),
+            "labor_last_week": sum(n for (_, activity), n in last_week.items() if activity == LABOR_ACTIVITY),
+            "inputs": sum(entries for entries, _ in inputs.values()),
+            "input_locations": len(inputs),  # the logbook location (the farm's country on the Logbook page)
+            "crops_week": sorted({crop for crop, _ in this_week}),
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+# The process-wide logbook store
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LogbookStore()
+        return _store
@@ -0,0 +1,82 @@
+import streamlit as st
+
+PAGE_SIZE = 50
+
+
+def _sort_key(value):
+    if value is None:
+        return (2, "")
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value).lower())
+
+
+# Positions of the rows (dicts) containing `text` in any column (case
+# insensitive), sorted by column `sort`
+def matching(rows, text="", sort=None, descending=False):
+    positions = range(len(rows))
+    if text:
+        needle = text.lower()
+        positions = [i for i in positions if any(needle in str(value).lower() for value in rows[i].values())]
+    if sort:
+        keys = [_sort_key(rows[i].get(sort)) for i in positions]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+        return [positions[i] for i in order]
+    return list(positions)[::-1] if descending else list(positions)
+
+
+# One page of a list of row dicts, filtered and sorted on the server so only
+# the page is sent to the browser. Returns (page rows, number of matching rows).
+def list_page(rows, text="", sort=None, descending=False, offset=0, limit=PAGE_SIZE):
+    positions = matching(rows, text, sort, descending)
+    return [rows[i] for i in positions[offset:offset + limit]], len(positions)
+
+
+# Offset of the page shown for table `key`; back to 0 when `query` (the
+# filters and sort in effect) changes
+def page_offset(key, query):
+    if st.session_state.get(f"{key}_query") != query:
+        st.session_state[f"{key}_query"] = query
+        st.session_state[f"{key}_offset"] = 0
+    return st.session_state[f"{key}_offset"]
+
+
+def _move(key, step):
+    st.session_state[f"{key}_offset"] += step
+
+
+# "Showing a–b of n" and Previous / Next buttons for table `key`
+def pager(key, offset, shown, total, page_size=PAGE_SIZE):
+    if total:
+        st.caption(f"Showing {offset + 1}–{offset + shown} of {total}")
+    previous_col, next_col = st.columns(2)
+    previous_col.button("⬅️ Previous", key=f"{key}_previous", disabled=offset == 0,
+                        on_click=_move, args=(key, -page_size))
+    next_col.button("Next ➡️", key=f"{key}_next", disabled=offset + page_size >= total,
+                    on_click=_move, args=(key, page_size))
+
+
+# Filter box, sort controls and one page of `rows` (a list of dicts) for table
+# `key`, in place of st.table(rows). `version` must change whenever the rows
+# do; it defaults to len(rows), which is only right for lists that grow by
+# appending. Pass one for anything else (e.g. a filtered subset).
+def paged_table(key, rows, columns=None, page_size=PAGE_SIZE, version=None):
+    if columns is None:
+        columns = list(rows[0]) if rows else []
+    filter_col, sort_col, order_col = st.columns([3, 2, 1])
+    text = filter_col.text_input("🔎 Filter", key=f"{key}_filter").strip()
+    sort = sort_col.selectbox("Sort by", ["(added)"] + columns, key=f"{key}_sort")
+    descending = order_col.toggle("Descending", key=f"{key}_descending")
+    sort = None if sort == "(added)" else sort
+
+    # Paging through the same result reuses its positions
+    query = (len(rows) if version is None else version, text, sort, descending)
+    offset = page_offset(key, query)
+    cached = st.session_state.get(f"{key}_matching")
+    if cached is None or cached[0] != query:
+        cached = st.session_state[f"{key}_matching"] = (query, matching(rows, text, sort, descending))
+    positions = cached[1]
+    page = [rows[i] for i in positions[offset:offset + page_size]]
+    st.dataframe([{column: row.get(column) for column in columns} for row in page],
+                 use_container_width=True, hide_index=True)
+    pager(key, offset, len(page), len(positions), page_size)
@@ -0,0 +1,267 @@
+import atexit
+import functools
+import os
+import threading
+import time
+
+# Per-section render timing for the Streamlit apps.
+#
+#   with render_timing.section("Crop Calendar", caches=[gantt.cache_stats]) as s:
+#       ...
+#       s.add_rows(len(df))
+#
+# or @render_timing.timed("name") on a section function, where
+# render_timing.add_rows(n) counts towards the innermost open section.
+# Each section records wall time, rows processed and cache hits / misses
+# (from the change in any "hits" / "*_hits" / "misses" counters of the
+# `caches` dicts, or s.hit() / s.miss()). The last run of every section is
+# kept per session for debug_panel(); process-wide totals are written as
+# Prometheus text, at most every FLUSH_EVERY seconds as sections finish
+# (fragment reruns included), to one file per process: METRICS_FILE with the
+# worker id before the extension (metrics.<worker>.prom), each series labelled
+# worker="<worker>". Set AGRIVIGOR_WORKER_ID to a stable id per worker slot
+# (e.g. the replica index) so a restarted worker reuses its file and series;
+# it defaults to the pid. The file is removed when the process exits.
+#
+# Off unless AGRIVIGOR_TIMING=1; when off, section() hands back one shared
+# no-op object and timed() returns the function unchanged.
+
+ENABLED = os.environ.get("AGRIVIGOR_TIMING", "") not in ("", "0")
+METRICS_FILE = os.environ.get(
+    "AGRIVIGOR_METRICS_FILE",
+    os.path.join(os.environ.get("AGRIVIGOR_DATA_DIR", ".agrivigor"), "metrics.prom"),
+)
+WORKER_ID = os.environ.get("AGRIVIGOR_WORKER_ID") or str(os.getpid())
+FLUSH_EVERY = 1.0  # seconds between metrics file writes
+SESSION_KEY = "_render_timings"
+
+_totals = {}  # section -> [runs, seconds, rows, hits, misses, last seconds]
+_lock = threading.Lock()
+_last_flush = 0.0
+_flush_timer = None  # writes the totals recorded after a throttled flush
+_open = threading.local()  # .stack of the sections open in this thread
+
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+def _cache_counts(caches):
+    hits = misses = 0
+    for stats in caches:
+        for key, value in stats.items():
+            if key == "hits" or key.endswith("_hits"):
+                hits += value
+            elif key == "misses":
+                misses += value
+    return hits, misses
+
+
+class _Noop:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_rows(self, n):
+        pass
+
+    def hit(self, n=1):
+        pass
+
+    def miss(self, n=1):
+        pass
+
+
+_NOOP = _Noop()
+
+
+class Section:
+    __slots__ = ("name", "rows", "hits", "misses", "seconds", "_caches", "_before", "_start")
+
+    def __init__(self, name, caches=()):
+        self.name = name
+        self.rows = self.hits = self.misses = 0
+        self.seconds = 0.0
+        self._caches = caches
+
+    def __enter__(self):
+        self._before = _cache_counts(self._caches)
+        _stack().append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._start
+        _stack().pop()
+        hits, misses = _cache_counts(self._caches)
+        self.hits += hits - self._before[0]
+        self.misses += misses - self._before[1]
+        _record(self)
+        return False
+
+    def add_rows(self, n):
+        self.rows += n
+
+    def hit(self, n=1):
+        self.hits += n
+
+    def miss(self, n=1):
+        self.misses += n
+
+
+def _stack():
+    if not hasattr(_open, "stack"):
+        _open.stack = []
+    return _open.stack
+
+
+def add_rows(n):
+    if ENABLED and _stack():
+        _stack()[-1].add_rows(n)
+
+
+def section(name, caches=()):
+    return Section(name, caches) if ENABLED else _NOOP
+
+
+# Decorator form of section(); use below @st.fragment so fragment reruns are timed
+def timed(name=None, caches=()):
+    def wrap(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            with Section(name or fn.__name__, caches):
+                return fn(*args, **kwargs)
+        return run
+    return wrap
+
+
+def _session_timings():
+    import streamlit as st
+
+    try:
+        return st.session_state.setdefault(SESSION_KEY, {})
+    except Exception:  # no script run context (plain python, tests)
+        return None
+
+
+def _record(s):
+    with _lock:
+        totals = _totals.setdefault(s.name, [0, 0.0, 0, 0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += s.seconds
+        totals[2] += s.rows
+        totals[3] += s.hits
+        totals[4] += s.misses
+        totals[5] = s.seconds
+    timings = _session_timings()
+    if timings is not None:
+        timings[s.name] = {
+            "ms": s.seconds * 1000, "rows": s.rows, "cache_hits": s.hits,
+            "cache_misses": s.misses, "at": time.time(),
+        }
+    flush()
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS = [
+    ("agrivigor_section_runs_total", "counter", "Section renders.", 0),
+    ("agrivigor_section_seconds_total", "counter", "Wall time spent rendering the section.", 1),
+    ("agrivigor_section_rows_total", "counter", "Rows processed by the section.", 2),
+    ("agrivigor_section_cache_hits_total", "counter", "Cache hits while rendering the section.", 3),
+    ("agrivigor_section_cache_misses_total", "counter", "Cache misses while rendering the section.", 4),
+    ("agrivigor_section_last_seconds", "gauge", "Wall time of the section's latest render.", 5),
+]
+
+
+def prometheus_text():
+    with _lock:
+        totals = {name: list(values) for name, values in _totals.items()}
+    lines = []
+    for metric, kind, help_text, i in METRICS:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{section="{_label(name)}",worker="{_label(WORKER_ID)}"}} {values[i]}'
+                  for name, values in sorted(totals.items())]
+    return "\n".join(lines) + "\n"
+
+
+# This process's metrics file
+def metrics_path():
+    root, ext = os.path.splitext(METRICS_FILE)
+    return f"{root}.{WORKER_ID}{ext}"
+
+
+# Write the Prometheus text file (atomically), at most every FLUSH_EVERY
+# seconds; a throttled call schedules a write for when the interval is up
+def flush(force=False):
+    global _last_flush, _flush_timer
+    now = time.monotonic()
+    with _lock:
+        if not _totals:
+            return
+        wait = FLUSH_EVERY - (now - _last_flush)
+        if not force and wait > 0:
+            if _flush_timer is None:
+                _flush_timer = threading.Timer(wait, _flush_later)
+                _flush_timer.daemon = True
+                _flush_timer.start()
+            return
+        _last_flush = now
+    path = metrics_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+# Remove this process's metrics file on exit, so stopped workers leave no
+# stale series behind
+@atexit.register
+def _remove_metrics_file():
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+    if _totals:
+        try:
+            os.remove(metrics_path())
+        except OSError:
+            pass
+
+
+def _flush_later():
+    global _flush_timer
+    with _lock:
+        _flush_timer = None
+    flush(force=True)
+
+
+# Sidebar expander with this session's latest timing per section; call at the
+# end of the script
+def debug_panel():
+    if not ENABLED:
+        return
+    import streamlit as st
+
+    timings = _session_timings() or {}
+    with st.sidebar.expander("⏱️ Render timings", expanded=False):
+        if not timings:
+            st.caption("No sections timed yet.")
+            return
+        rows = sorted(({"Section": name, **values} for name, values in timings.items()),
+                      key=lambda row: -row["ms"])
+        for row in rows:
+            row["at"] = time.strftime("%H:%M:%S", time.localtime(row["at"]))
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+        st.caption(f"Metrics file: {metrics_path()}")
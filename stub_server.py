@@ -0,0 +1,151 @@
+import copy
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local stand-in for the OpenWeather /data/2.5/forecast and Nominatim /search endpoints.
+# Run `python stub_server.py 8001` and point OPENWEATHER_URL / NOMINATIM_URL at http://127.0.0.1:8001
+
+
+# Build a 5-day / 3-hour forecast payload shaped like OpenWeather's response
+def make_forecast(lat, lon, start=None, slots=40):
+    start = int(start if start is not None else time.time()) // 10800 * 10800
+    seed = int(abs(lat * 1000) + abs(lon * 1000))
+    entries = []
+    for i in range(slots):
+        k = (seed + i * 7) % 100
+        entry = {
+            "dt": start + i * 10800,
+            "main": {
+                "temp": 24 + (k % 10),
+                "temp_min": 22 + (k % 8),
+                "temp_max": 26 + (k % 10),
+                "humidity": 60 + (k % 40),
+            },
+            "wind": {"speed": round((k % 20) * 0.9, 1)},
+        }
+        if k % 3 == 0:
+            entry["rain"] = {"3h": round((k % 30) * 0.8, 1)}
+        entries.append(entry)
+    return {
+        "cod": "200",
+        "cnt": slots,
+        "list": entries,
+        "city": {"coord": {"lat": lat, "lon": lon}, "timezone": 0},
+    }
+
+
+# Nominatim-style search result; an empty list for queries containing "nowhere"
+def make_search(query):
+    if "nowhere" in query.lower():
+        return []
+    seed = sum(ord(c) for c in query)
+    return [{"lat": str(round((seed % 180) - 90 + 0.5, 4)), "lon": str(round((seed * 7 % 360) - 180 + 0.5, 4)),
+             "display_name": query}]
+
+
+class ForecastHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so pooled clients reuse sockets
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def do_GET(self):
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        fixtures = self.server.fixtures
+        if parsed.path == "/search" and "q" in query:
+            self.server.requests_served += 1
+            q = query["q"][0]
+            if "search" in fixtures:
+                self._send(200, fixtures["search"].get(q.strip().lower(), []))
+            else:
+                self._send(200, make_search(q))
+            return
+        if parsed.path != "/data/2.5/forecast" or "lat" not in query or "lon" not in query:
+            self._send(404, {"cod": "404", "message": "not found"})
+            return
+        self.server.requests_served += 1
+        lat, lon = float(query["lat"][0]), float(query["lon"][0])
+        if self.server.forecast_template:
+            coord = json.dumps({"lat": lat, "lon": lon}).encode("utf-8")
+            self._send_body(200, self.server.forecast_template.replace(b'"__COORD__"', coord))
+        else:
+            self._send(200, make_forecast(lat, lon))
+
+    def _send(self, status, payload):
+        self._send_body(status, json.dumps(payload).encode("utf-8"))
+
+    def _send_body(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    # `fixtures` may hold recorded payloads to replay instead of synthetic ones:
+    # {"forecast": <OpenWeather response>, "search": {query: <Nominatim results>}}
+    def __init__(self, address, handler=ForecastHandler, fixtures=None):
+        super().__init__(address, handler)
+        self.fixtures = fixtures or {}
+        # Recorded forecast encoded once; only city.coord changes per request
+        self.forecast_template = None
+        if "forecast" in self.fixtures:
+            template = copy.deepcopy(self.fixtures["forecast"])
+            template.setdefault("city", {})["coord"] = "__COORD__"
+            self.forecast_template = json.dumps(template).encode("utf-8")
+        self.requests_served = 0
+        self.delay = 0  # seconds to stall before answering, to imitate a slow upstream
+
+    # Clients that gave up on a slow response close the socket; that is expected
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+# Start a stub server on a background thread; port 0 picks a free port
+def start_stub_server(port=0, handler=ForecastHandler, fixtures=None):
+    server = StubServer(("127.0.0.1", port), handler, fixtures)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _serve(port, fixtures, delay, ready):
+    server = StubServer(("127.0.0.1", port), fixtures=fixtures)
+    server.delay = delay
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+# Start a stub server in a child process so it does not compete with the client
+# for the GIL; returns (process, base_url). Stop it with process.terminate().
+def start_stub_process(port=0, fixtures=None, delay=0):
+    import multiprocessing
+
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(port, fixtures, delay, ready), daemon=True)
+    process.start()
+    return process, f"http://127.0.0.1:{ready.get(timeout=10)}"
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8001
+    server = StubServer(("127.0.0.1", port))
+    print(f"Stub OpenWeather listening on {server.base_url}")
+    server.serve_forever()
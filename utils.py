@@ -1,44 +1,553 @@
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
 
-# Get coordinates of a location
-def get_coords(location):
-    url = f"https://nominatim.openstreetmap.org/search?format=json&q={location}"
-    response = requests.get(url).json()
-    if response:
-        return float(response[0]["lat"]), float(response[0]["lon"])
+import gazetteer
+import weather_risk
+
+OPENWEATHER_URL = os.environ.get("OPENWEATHER_URL", "https://api.openweathermap.org")
+NOMINATIM_URL = os.environ.get("NOMINATIM_URL", "https://nominatim.openstreetmap.org")
+DATA_DIR = os.environ.get("AGRIVIGOR_DATA_DIR", ".agrivigor")
+REQUEST_TIMEOUT = (3, 5)  # (connect, read) seconds
+RETRIES = 2  # extra attempts after the first one
+BACKOFF_BASE = 0.25  # seconds; doubles per attempt, full jitter
+BACKOFF_MAX = 2.0
+NOMINATIM_RATE = 1.0  # requests per second, per Nominatim's usage policy
+MAX_QUEUE_WAIT = 10.0  # seconds a caller may wait for a rate-limit slot
+MAX_CONCURRENCY = 16
+FORECAST_FRESH_FOR = 60 * 60  # serve from cache without refreshing
+FORECAST_STALE_FOR = 6 * 60 * 60  # serve stale and refresh in the background
+GEOCODE_TOUCH_BATCH = 256  # cache hits noted in memory before last_used is written
+
+# Shared HTTP session so every call reuses pooled keep-alive connections
+_session = requests.Session()
+_session.headers["User-Agent"] = "agrivigor-dashboard"
+_pool_size = 0
+_pool_lock = threading.Lock()
+
+
+# Make the session keep at least `size` connections per host, so that many
+# concurrent requests reuse connections instead of discarding the extras
+# ("Connection pool is full"). The pool only ever grows.
+def _ensure_pool(size):
+    global _pool_size
+    with _pool_lock:
+        if size <= _pool_size:
+            return
+        _session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=size))
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=size))
+        _pool_size = size
+
+
+_ensure_pool(MAX_CONCURRENCY)
+
+
+# Path of a file inside the local data directory
+def data_path(name):
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, name)
+
+
+# Raised when an upstream is failing and no cached payload can stand in
+class UpstreamUnavailable(requests.RequestException):
+    pass
+
+
+# Trips after `failure_threshold` consecutive failures and rejects calls for
+# `reset_after` seconds; then lets one trial call through (half-open).
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, reset_after=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_after:
+                return "half-open"
+            return "open"
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_after or self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+breakers = {
+    "openweather": CircuitBreaker("openweather"),
+    "nominatim": CircuitBreaker("nominatim"),
+}
+
+
+# Token bucket limiter. Callers reserve the next free slot under the lock and
+# sleep outside it, so waiting callers are served in arrival order.
+class TokenBucket:
+    def __init__(self, rate, capacity=1, max_wait=MAX_QUEUE_WAIT):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self.stats = {"acquired": 0, "rejected": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0}
+        self._waits = deque(maxlen=1000)
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Blocks until a token is available; raises UpstreamUnavailable if that
+    # would take longer than max_wait. Returns the time spent waiting.
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if wait > self.max_wait:
+                self.stats["rejected"] += 1
+                raise UpstreamUnavailable(f"rate limit queue wait {wait:.1f}s exceeds {self.max_wait}s")
+            self._tokens -= 1
+            self.stats["acquired"] += 1
+            self.stats["total_wait"] += wait
+            self.stats["max_wait"] = max(self.stats["max_wait"], wait)
+            if wait:
+                self.stats["waited"] += 1
+            self._waits.append(wait)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    # Queue wait metrics, in milliseconds, over the last 1000 acquisitions
+    def wait_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            waits = sorted(self._waits)
+        if waits:
+            stats["p50_wait_ms"] = waits[len(waits) // 2] * 1000
+            stats["p95_wait_ms"] = waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000
+        stats["mean_wait_ms"] = stats["total_wait"] / stats["acquired"] * 1000 if stats["acquired"] else 0.0
+        stats["max_wait_ms"] = stats.pop("max_wait") * 1000
+        return stats
+
+
+limiters = {
+    "nominatim": TokenBucket(NOMINATIM_RATE),
+}
+
+
+# Single-flight: concurrent calls for the same key share one execution
+class SingleFlight:
+    def __init__(self):
+        self.stats = {"calls": 0, "coalesced": 0}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        with self._lock:
+            self.stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "result": None, "error": None}
+            else:
+                self.stats["coalesced"] += 1
+
+        if leader:
+            try:
+                call["result"] = fn(*args)
+            except Exception as exc:
+                call["error"] = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call["done"].set()
+        else:
+            call["done"].wait()
+
+        if call["error"] is not None:
+            raise call["error"]
+        return call["result"]
+
+
+def _is_retryable(response):
+    return response.status_code == 429 or response.status_code >= 500
+
+
+# GET with bounded timeouts, jittered exponential backoff and a circuit breaker.
+# Returns the final response (which may be a non-retryable 4xx).
+def _get(upstream, url, params, timeout=None):
+    breaker = breakers[upstream]
+    limiter = limiters.get(upstream)
+    # Queue for the rate limit before asking the breaker, so a rejected token
+    # never leaves a half-open trial claimed
+    if limiter is not None:
+        limiter.acquire()
+    if not breaker.allow():
+        raise UpstreamUnavailable(f"{upstream} circuit open")
+
+    # From here on every exit records a success or a failure, which also
+    # releases a half-open trial
+    succeeded = False
+    try:
+        for attempt in range(RETRIES + 1):
+            if attempt and limiter is not None:
+                limiter.acquire()
+            try:
+                response = _session.get(url, params=params, timeout=timeout or REQUEST_TIMEOUT)
+                if not _is_retryable(response):
+                    succeeded = True
+                    return response
+                error = requests.HTTPError(f"{upstream} returned {response.status_code}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = exc
+            if attempt < RETRIES:
+                time.sleep(random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)))
+        raise error
+    finally:
+        if succeeded:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+
+# Persistent geocoding cache: SQLite table with TTL and LRU eviction
+class GeoCache:
+    def __init__(self, path=None, ttl=30 * 24 * 3600, max_entries=5000):
+        self.path = path or data_path("geocode.sqlite")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._touched = {}  # query -> last use not yet written to last_used
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode ("
+            "query TEXT PRIMARY KEY, lat REAL, lon REAL, "
+            "fetched_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS geocode_last_used ON geocode (last_used)")
+        self._conn.commit()
+
+    # Returns (lat, lon), (None, None) for a cached "not found", or None on a miss.
+    # Expired rows are kept (LRU eviction removes them) so they can serve as a
+    # fallback while Nominatim is down. Hits are only noted in memory; the
+    # last_used updates are written together by put(), before it evicts, or
+    # once GEOCODE_TOUCH_BATCH of them are pending.
+    def get(self, query, allow_expired=False):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT lat, lon, fetched_at FROM geocode WHERE query = ?", (query,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[2] > self.ttl and not allow_expired:
+                return None
+            self._touched[query] = now
+            if len(self._touched) >= GEOCODE_TOUCH_BATCH:
+                self._write_touches()
+                self._conn.commit()
+            return row[0], row[1]
+
+    # Write the pending last_used updates; call with the lock held
+    def _write_touches(self):
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE geocode SET last_used = ? WHERE query = ?",
+                [(used, query) for query, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def put(self, query, lat, lon):
+        now = time.time()
+        with self._lock:
+            self._write_touches()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?, ?)",
+                (query, lat, lon, now, now),
+            )
+            # Evict least recently used rows beyond the size bound
+            self._conn.execute(
+                "DELETE FROM geocode WHERE query IN ("
+                "SELECT query FROM geocode ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM geocode").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM geocode")
+            self._conn.commit()
+
+
+_geo_cache = None
+_geo_stats = {"gazetteer_hits": 0, "cache_hits": 0, "misses": 0, "fallbacks": 0, "network_seconds": 0.0}
+_geo_stats_lock = threading.Lock()
+_geo_flight = SingleFlight()
+
+
+def _get_geo_cache():
+    global _geo_cache
+    if _geo_cache is None:
+        _geo_cache = GeoCache()
+    return _geo_cache
+
+
+def _count(stats, lock, key, amount=1):
+    with lock:
+        stats[key] += amount
+
+
+# Hit/miss counters for get_coords, plus the network time the hits saved
+def geocode_stats():
+    with _geo_stats_lock:
+        stats = dict(_geo_stats)
+    hits = stats["gazetteer_hits"] + stats["cache_hits"]
+    lookups = hits + stats["misses"]
+    avg_miss = stats["network_seconds"] / stats["misses"] if stats["misses"] else 0.0
+    stats["hit_rate"] = hits / lookups if lookups else 0.0
+    stats["avg_miss_ms"] = avg_miss * 1000
+    stats["estimated_saved_ms"] = hits * avg_miss * 1000
+    stats["coalesced"] = _geo_flight.stats["coalesced"]
+    stats["rate_limit"] = limiters["nominatim"].wait_stats()
+    return stats
+
+
+def _nominatim_search(location):
+    url = f"{NOMINATIM_URL}/search"
+    response = _get("nominatim", url, {"format": "json", "q": location})
+    response.raise_for_status()
+    results = response.json()
+    if results:
+        return float(results[0]["lat"]), float(results[0]["lon"])
     return None, None
 
-# Fetch weather forecast using OpenWeather API
-def fetch_forecast(lat, lon, api_key):
-    url = (
-        f"https://api.openweathermap.org/data/2.5/forecast?"
-        f"lat={lat}&lon={lon}&appid={api_key}&units=metric"
-    )
-    response = requests.get(url)
+
+def _search_and_cache(location, key, cache):
+    lat, lon = _nominatim_search(location)
+    cache.put(key, lat, lon)
+    return lat, lon
+
+
+# Get coordinates of a location (gazetteer, then disk cache, then Nominatim)
+def get_coords(location):
+    coords = gazetteer.lookup(location)
+    if coords:
+        _count(_geo_stats, _geo_stats_lock, "gazetteer_hits")
+        return coords
+
+    key = location.strip().lower()
+    cache = _get_geo_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        _count(_geo_stats, _geo_stats_lock, "cache_hits")
+        return cached
+
+    start = time.perf_counter()
+    try:
+        # Concurrent lookups for the same location share one Nominatim request
+        lat, lon = _geo_flight.do(key, _search_and_cache, location, key, cache)
+    except requests.RequestException:
+        # Upstream failing: fall back to an expired entry if there is one
+        _count(_geo_stats, _geo_stats_lock, "fallbacks")
+        return cache.get(key, allow_expired=True) or (None, None)
+    finally:
+        _count(_geo_stats, _geo_stats_lock, "misses")
+        _count(_geo_stats, _geo_stats_lock, "network_seconds", time.perf_counter() - start)
+    return lat, lon
+
+
+# In-memory forecast cache keyed on rounded coordinates, shared by all sessions.
+# Entries younger than fresh_for are served as-is; up to stale_for they are served
+# immediately while a background refresh replaces them.
+class ForecastCache:
+    def __init__(self, fresh_for=FORECAST_FRESH_FOR, stale_for=FORECAST_STALE_FOR,
+                 precision=2, max_entries=10000):
+        self.fresh_for = fresh_for
+        self.stale_for = stale_for
+        self.precision = precision
+        self.max_entries = max_entries
+        self.stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "fallbacks": 0}
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def key(self, lat, lon):
+        return round(float(lat), self.precision), round(float(lon), self.precision)
+
+    # Returns (data, age_seconds) or None
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], time.time() - entry[1]
+
+    def put(self, key, data):
+        with self._lock:
+            self._entries[key] = (data, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # Claim the right to refresh a key; False if a refresh is already running
+    def start_refresh(self, key):
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+forecast_cache = ForecastCache()
+_refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="forecast-refresh")
+
+
+def _download_forecast(lat, lon, api_key, timeout, base_url):
+    url = f"{base_url or OPENWEATHER_URL}/data/2.5/forecast"
+    params = {"lat": lat, "lon": lon, "appid": api_key, "units": "metric"}
+    response = _get("openweather", url, params, timeout)
     if response.ok:
         return response.json()
     return None
 
-# Define risk rules and detect alerts
-def analyze_weather(weather_data):
-    alerts = []
-    if not weather_data or "list" not in weather_data:
-        return alerts
-
-    high_humidity_threshold = 90
-    rain_threshold = 20  # mm
-    wind_threshold = 15  # m/s
-
-    for entry in weather_data["list"][:8]:  # roughly 24h
-        humidity = entry["main"]["humidity"]
-        rain = entry.get("rain", {}).get("3h", 0)
-        wind = entry["wind"]["speed"]
-
-        if humidity > high_humidity_threshold:
-            alerts.append("💧 High Humidity Stress")
-        if rain > rain_threshold:
-            alerts.append("🌧️Heavy Rain Risk")
-        if wind > wind_threshold:
-            alerts.append("💨Wind Damage Risk")
-    return list(set(alerts))
 
+def _refresh_forecast(key, lat, lon, api_key, timeout, base_url):
+    cache = forecast_cache
+    try:
+        data = _download_forecast(lat, lon, api_key, timeout, base_url)
+        if data is not None:
+            cache.put(key, data)
+    except requests.RequestException:
+        pass  # keep serving the stale copy
+    finally:
+        cache.end_refresh(key)
+
+
+# Fetch weather forecast using OpenWeather API (through the shared forecast cache).
+# Returns None if the upstream fails and nothing is cached for these coordinates.
+def fetch_forecast(lat, lon, api_key, timeout=None, base_url=None, use_cache=True):
+    if not use_cache:
+        try:
+            return _download_forecast(lat, lon, api_key, timeout, base_url)
+        except requests.RequestException:
+            return None
+
+    cache = forecast_cache
+    key = cache.key(lat, lon)
+    cached = cache.get(key)
+    if cached is not None:
+        data, age = cached
+        if age < cache.fresh_for:
+            cache.count("fresh_hits")
+            return data
+        if age < cache.stale_for:
+            cache.count("stale_hits")
+            if cache.start_refresh(key):
+                cache.count("refreshes")
+                _refresh_pool.submit(_refresh_forecast, key, lat, lon, api_key, timeout, base_url)
+            return data
+
+    cache.count("misses")
+    try:
+        data = _download_forecast(lat, lon, api_key, timeout, base_url)
+    except requests.RequestException:
+        # Upstream failing: serve the last good payload, however old
+        cache.count("fallbacks")
+        return cached[0] if cached is not None else None
+    if data is not None:
+        cache.put(key, data)
+    return data
+
+
+# Fetch forecasts for many (lat, lon) pairs concurrently.
+# Yields ((lat, lon), forecast) as each request finishes; forecast is None on failure.
+def fetch_forecasts(coords, api_key, max_concurrency=MAX_CONCURRENCY,
+                    timeout=None, base_url=None, use_cache=True):
+    coords = list(coords)
+    if not coords:
+        return
+    workers = max(1, min(max_concurrency, len(coords)))
+    _ensure_pool(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(fetch_forecast, lat, lon, api_key, timeout, base_url, use_cache): (lat, lon)
+            for lat, lon in coords
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except requests.RequestException:
+                    data = None
+                yield futures[future], data
+        finally:
+            # Caller stopped early: drop whatever has not started yet
+            for future in futures:
+                future.cancel()
+
+
+# Alert labels analyze_weather has always returned, per alert_rules risk
+ALERT_LABELS = {
+    "Humidity Stress": "💧 High Humidity Stress",
+    "Heavy Rain": "🌧️Heavy Rain Risk",
+    "Strong Winds": "💨Wind Damage Risk",
+}
+
+
+# Detect weather alerts in the next ~24h (first 8 three-hour slots), using the
+# alert_rules rules for `crop` and `country` when given. Returns one label per
+# triggered risk: the old strings above for humidity / rain / wind, and the
+# alert_rules risk name for the risks added with the rules (e.g. "High
+# Temperature", "Flooding"). Accepts an OpenWeather response or a
+# ForecastStore.farm view.
+# See weather_risk.detect_alerts for timestamped, severity-graded alerts over the full horizon.
+def analyze_weather(weather_data, crop=None, country=None):
+    if weather_data is None or ("list" not in weather_data and "dt" not in weather_data):
+        return []
+    return [ALERT_LABELS.get(risk, risk) for risk in weather_risk.risk_names(weather_data, crop, country, max_slots=8)]
@@ -0,0 +1,150 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
+
+import alert_rules
+
+# Forecast arrays for the alert rules in alert_rules.py, which hold every
+# threshold (general, crop- and country-specific). This module turns
+# OpenWeather responses into columnar arrays and wraps alert_rules.evaluate
+# for single forecasts. risk_names is the cheap path for one forecast, which is
+# too small for the array set-up to pay off.
+
+
+FIELDS = {"dt": np.int64, "temp": np.float32, "humidity": np.float32, "rain": np.float32, "wind": np.float32}
+
+
+# One pass over the entries of many forecasts into flat per-field arrays.
+# Returns (arrays, entries per forecast).
+def _flatten(forecasts):
+    dts, temps, humidities, rains, winds = [], [], [], [], []
+    counts = []
+    for forecast in forecasts:
+        entries = (forecast or {}).get("list") or ()
+        counts.append(len(entries))
+        for e in entries:
+            main, rain = e["main"], e.get("rain")
+            dts.append(e["dt"])
+            temps.append(main["temp"])
+            humidities.append(main["humidity"])
+            rains.append(rain.get("3h", 0) if rain else 0)
+            winds.append(e["wind"]["speed"])
+    columns = zip(FIELDS, (dts, temps, humidities, rains, winds))
+    return {name: np.array(values, dtype=FIELDS[name]) for name, values in columns}, np.array(counts, dtype=np.int64)
+
+
+# Convert one OpenWeather forecast into columnar arrays.
+# Columnar input (e.g. a ForecastStore.farm view) is passed through untouched.
+def forecast_arrays(weather_data):
+    if weather_data is not None and "dt" in weather_data:
+        return weather_data
+    return _flatten([weather_data])[0]
+
+
+# Stack many forecasts into (farms x slots) arrays; missing slots are NaN / dt 0.
+# Convert once and keep the result (ForecastStore does) rather than converting
+# on every evaluation: walking the JSON costs more than evaluating the rules.
+def batch_arrays(forecasts):
+    flat, counts = _flatten(forecasts)
+    slots = int(counts.max()) if len(counts) else 0
+    if len(counts) and counts.min() == slots:
+        # Every forecast has the full horizon: the flat arrays reshape in place
+        return {name: column.reshape(len(counts), slots) for name, column in flat.items()}
+
+    # Row/column of every flattened entry in the padded grid
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    batch = {}
+    for name, column in flat.items():
+        grid = np.zeros((len(counts), slots), dtype=column.dtype)
+        if name != "dt":
+            grid.fill(np.nan)
+        grid[rows, cols] = column
+        batch[name] = grid
+    return batch
+
+
+# Evaluate the alert rules over all farms and slots at once.
+# `arrays` comes from batch_arrays / ForecastStore.arrays (2-D) or forecast_arrays
+# (1-D, treated as one farm). `crops` / `countries` give each farm's crop and
+# country (None: only the general rules apply). `max_slots` limits evaluation
+# to the first slots, `mask` to selected ones. Returns alert_rules.ALERT_DTYPE alerts.
+def evaluate(arrays, crops=None, countries=None, rules=None, max_slots=None, mask=None):
+    arrays = {k: np.atleast_2d(v) for k, v in arrays.items()}
+    n_farms, n_slots = arrays["dt"].shape
+    if max_slots is not None:
+        limit = np.arange(n_slots) < max_slots
+        mask = limit if mask is None else np.atleast_2d(mask) & limit
+    return alert_rules.evaluate(
+        alert_rules.compile_rules(rules), arrays,
+        crops if crops is not None else [None] * n_farms,
+        countries if countries is not None else [None] * n_farms,
+        mask=mask,
+    )
+
+
+# The default rules in force for one crop and country, as plain tuples
+@lru_cache(maxsize=256)
+def _rules_for(crop, country):
+    rule_set = alert_rules.compile_rules()
+    in_force = rule_set.applicable([crop], [country])[0]
+    return tuple(
+        (rule["risk"], rule["field"], rule["op"], rule.get("window", 1), rule["value"])
+        for rule, on in zip(rule_set.rules, in_force) if on
+    )
+
+
+# Names of the default-rule risks triggered in one OpenWeather forecast, within
+# the first `max_slots` slots; same result as evaluate + alert_labels, without
+# building arrays. Columnar input goes through evaluate.
+def risk_names(weather_data, crop=None, country=None, max_slots=None):
+    if "dt" in weather_data:
+        return alert_labels(evaluate(weather_data, [crop], [country], max_slots=max_slots), 1)[0]
+    columns = {"temp": [], "humidity": [], "rain": [], "wind": []}
+    for e in (weather_data.get("list") or ())[:max_slots]:
+        rain = e.get("rain")
+        columns["temp"].append(e["main"]["temp"])
+        columns["humidity"].append(e["main"]["humidity"])
+        columns["rain"].append(rain.get("3h", 0) if rain else 0)
+        columns["wind"].append(e["wind"]["speed"])
+
+    hit = set()
+    for risk, field, op, window, value in _rules_for(crop, country):
+        if risk in hit:
+            continue
+        values = columns[field]
+        if window > 1:
+            # Rolling sums over full windows only, as alert_rules._windowed
+            values = [sum(values[i - window:i]) for i in range(window, len(values) + 1)]
+        if any(v > value for v in values) if op == ">" else any(v < value for v in values):
+            hit.add(risk)
+    return sorted(hit)
+
+
+# Structured alerts for one forecast over its whole horizon
+def detect_alerts(weather_data, crop=None, country=None, rules=None):
+    rule_set = alert_rules.compile_rules(rules)
+    alerts = evaluate(forecast_arrays(weather_data), [crop], [country], rules)
+    return [
+        {
+            "time": datetime.fromtimestamp(int(a["dt"]), tz=timezone.utc),
+            "slot": int(a["slot"]),
+            "risk": rule["risk"],
+            "field": rule["field"],
+            "value": round(float(a["value"]), 2),
+            "threshold": rule["value"],
+            "severity": rule.get("severity", "warning"),
+            "action": rule["action"],
+        }
+        for a in alerts
+        for rule in [rule_set.rules[a["rule"]]]
+    ]
+
+
+# Unique risk names per farm, in rule order
+def alert_labels(alerts, n_farms, rules=None):
+    rule_set = alert_rules.compile_rules(rules)
+    hit = np.zeros((n_farms, len(rule_set.risks)), dtype=bool)
+    hit[alerts["farm"], rule_set.risk_of_rule[alerts["rule"]]] = True
+    return [[rule_set.risks[r] for r in np.flatnonzero(row)] for row in hit]